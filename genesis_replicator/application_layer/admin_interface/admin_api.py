@@ -5,10 +5,12 @@ Implements administrative API endpoints for the Genesis Replicator Framework.
 """
 from typing import Dict, Any, List, Optional
 import logging
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Security, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
 from datetime import datetime
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,7 +35,10 @@ class AdminAPI:
 
     def __init__(self):
         """Initialize the Admin API."""
-        self.app = FastAPI(title="Genesis Replicator Admin API")
+        self.app = FastAPI(
+            title="Genesis Replicator Admin API",
+            default_response_class=ORJSONResponse
+        )
         self.oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
         self._setup_routes()
         logger.info("Admin API initialized")
@@ -43,21 +48,27 @@ class AdminAPI:
         @self.app.get("/system/status")
         async def get_system_status(
             token: str = Depends(self.oauth2_scheme)
-        ) -> Dict[str, Any]:
+        ) -> Response:
             """Get system status information."""
             try:
-                metrics = SystemMetrics(
+                # Values come from trusted internal getters, skip validation
+                metrics = SystemMetrics.model_construct(
                     agent_count=self._get_agent_count(),
                     active_models=self._get_active_models(),
                     memory_usage=self._get_memory_usage(),
                     cpu_usage=self._get_cpu_usage(),
                     uptime=self._get_uptime()
                 )
-                return {
+                payload = {
                     "status": "healthy",
                     "metrics": metrics.dict(),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now()
                 }
+                # Encode directly to skip response-model validation
+                return Response(
+                    content=orjson.dumps(payload),
+                    media_type="application/json"
+                )
             except Exception as e:
                 logger.error(f"Failed to get system status: {str(e)}")
                 raise HTTPException(
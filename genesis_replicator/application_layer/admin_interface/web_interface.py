@@ -9,12 +9,24 @@ from fastapi import FastAPI, Request, HTTPException
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
+from starlette.responses import Response
 import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ImmutableStaticFiles(StaticFiles):
+    """Static file handler that marks assets as cacheable forever."""
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build the file response with a long-lived Cache-Control header."""
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return response
+
 class WebInterface:
     """Web-based administrative interface implementation."""
 
@@ -29,7 +41,11 @@ class WebInterface:
     def _setup_static_files(self) -> None:
         """Set up static file serving."""
         static_dir = os.path.join(os.path.dirname(__file__), "static")
-        self.app.mount("/static", StaticFiles(directory=static_dir), name="static")
+        self.app.mount(
+            "/static",
+            ImmutableStaticFiles(directory=static_dir, html=False, check_dir=False),
+            name="static"
+        )
 
     def _setup_routes(self) -> None:
         """Set up web interface routes."""
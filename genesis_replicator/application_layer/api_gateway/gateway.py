@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from fastapi import FastAPI, Request, Response, HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import jwt
 import redis
 
@@ -36,7 +37,10 @@ class APIGateway:
         jwt_secret: str = "your-secret-key"
     ):
         """Initialize the API Gateway."""
-        self.app = FastAPI(title="Genesis Replicator API")
+        self.app = FastAPI(
+            title="Genesis Replicator API",
+            default_response_class=ORJSONResponse
+        )
         self.redis = redis.from_url(redis_url)
         self.jwt_secret = jwt_secret
         self.routes: List[Route] = []
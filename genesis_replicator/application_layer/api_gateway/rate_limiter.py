@@ -5,7 +5,8 @@ Implements rate limiting functionality.
 """
 from typing import Dict, Optional
 import logging
-from datetime import datetime, timedelta
+import time
+import uuid
 import redis
 from dataclasses import dataclass
 
@@ -13,6 +14,25 @@ from dataclasses import dataclass
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sliding window length in milliseconds
+WINDOW_MS = 60000
+
+# Sliding-window check executed atomically on the Redis server:
+# drop entries older than the window, then admit the request only if the
+# remaining count is below the limit. Returns 1 if admitted, 0 otherwise.
+#   KEYS[1] = rate limit key
+#   ARGV[1] = current time (ms), ARGV[2] = unique member, ARGV[3] = limit
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - %d)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[2])
+redis.call('PEXPIRE', KEYS[1], %d)
+return 1
+""" % (WINDOW_MS, WINDOW_MS)
+
 @dataclass
 class RateLimitConfig:
     """Configuration for rate limiting."""
@@ -21,7 +41,7 @@ class RateLimitConfig:
     key_prefix: str = "rate_limit"
 
 class RateLimiter:
-    """Implements token bucket rate limiting."""
+    """Implements sliding-window rate limiting."""
 
     def __init__(
         self,
@@ -39,6 +59,9 @@ class RateLimiter:
         self.default_config = default_config or RateLimitConfig(
             requests_per_minute=60
         )
+        self._sliding_window = self.redis.register_script(
+            SLIDING_WINDOW_SCRIPT
+        )
         logger.info("Rate Limiter initialized")
 
     def _get_key(self, identifier: str, key_prefix: str) -> str:
@@ -63,26 +86,19 @@ class RateLimiter:
         cfg = config or self.default_config
         key = self._get_key(identifier, cfg.key_prefix)
 
-        try:
-            current = self.redis.get(key)
-            if current is None:
-                # First request
-                self.redis.setex(
-                    key,
-                    60,  # 1 minute expiry
-                    1
-                )
-                return True
+        now_ms = int(time.time() * 1000)
 
-            count = int(current)
-            if count >= cfg.requests_per_minute:
+        try:
+            allowed = self._sliding_window(
+                keys=[key],
+                args=[now_ms, uuid.uuid4().hex, cfg.requests_per_minute]
+            )
+            if not allowed:
                 logger.warning(
                     f"Rate limit exceeded for {identifier}"
                 )
                 return False
 
-
-            self.redis.incr(key)
             return True
 
         except redis.RedisError as e:
@@ -122,12 +138,10 @@ class RateLimiter:
         cfg = config or self.default_config
         key = self._get_key(identifier, cfg.key_prefix)
 
-        try:
-            current = self.redis.get(key)
-            if current is None:
-                return cfg.requests_per_minute
+        now_ms = int(time.time() * 1000)
 
-            count = int(current)
+        try:
+            count = self.redis.zcount(key, f"({now_ms - WINDOW_MS}", "+inf")
             return max(0, cfg.requests_per_minute - count)
 
         except redis.RedisError as e:
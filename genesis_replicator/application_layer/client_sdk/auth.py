@@ -6,21 +6,35 @@ Handles authentication and session management for the Genesis Replicator Framewo
 from typing import Dict, Optional, Any
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
 import jwt
+import orjson
+import time
 import uuid
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The header never changes for HS256 tokens, so encode it once.
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+# Session lifetime in seconds (24 hours)
+SESSION_TTL = 86400
+
 @dataclass
 class Session:
     """Represents an authenticated session."""
     session_id: str
     user_id: str
-    created_at: datetime
-    expires_at: datetime
+    created_at: int  # Unix timestamp (seconds)
+    expires_at: int  # Unix timestamp (seconds)
     token: str
     metadata: Dict[str, Any]
 
@@ -30,9 +44,28 @@ class AuthManager:
     def __init__(self, secret_key: str = "your-secret-key"):
         """Initialize the AuthManager."""
         self.secret_key = secret_key
+        self._sign_key = secret_key.encode()
         self.active_sessions: Dict[str, Session] = {}
         logger.info("Auth Manager initialized")
 
+    def _encode_token(self, payload: Dict[str, Any]) -> str:
+        """
+        Sign a payload as an HS256 JWT.
+
+        Equivalent to ``jwt.encode(payload, secret_key, algorithm="HS256")``
+        but reuses the pre-encoded header and key bytes instead of
+        re-deriving them on every call.
+
+        Args:
+            payload: Claims to encode
+
+        Returns:
+            Compact serialized JWT
+        """
+        signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+        signature = hmac.new(self._sign_key, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + _b64url(signature)).decode()
+
     def authenticate(
         self,
         credentials: Dict[str, str]
@@ -53,17 +86,17 @@ class AuthManager:
 
         try:
             # Create session with JWT token
-            session_id = str(uuid.uuid4())
-            created_at = datetime.now()
-            expires_at = created_at + timedelta(hours=24)
+            session_id = uuid.uuid4().hex
+            created_at = int(time.time())
+            expires_at = created_at + SESSION_TTL
 
             payload = {
                 "session_id": session_id,
                 "user_id": credentials["user_id"],
-                "exp": int(expires_at.timestamp())
+                "exp": expires_at
             }
 
-            token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+            token = self._encode_token(payload)
 
             session = Session(
                 session_id=session_id,
@@ -75,11 +108,11 @@ class AuthManager:
             )
 
             self.active_sessions[session_id] = session
-            logger.info(f"Authentication successful for user: {credentials['user_id']}")
+            logger.info("Authentication successful for user: %s", credentials['user_id'])
             return session
 
         except Exception as e:
-            logger.error(f"Authentication failed: {str(e)}")
+            logger.error("Authentication failed: %s", e)
             return None
 
     def validate_session(self, token: str) -> Optional[Session]:
@@ -97,12 +130,12 @@ class AuthManager:
             session_id = payload["session_id"]
 
             if session_id not in self.active_sessions:
-                logger.warning(f"Session not found: {session_id}")
+                logger.warning("Session not found: %s", session_id)
                 return None
 
             session = self.active_sessions[session_id]
-            if datetime.now() > session.expires_at:
-                logger.warning(f"Session expired: {session_id}")
+            if time.time() > session.expires_at:
+                logger.warning("Session expired: %s", session_id)
                 self.revoke_session(session_id)
                 return None
 
@@ -124,7 +157,7 @@ class AuthManager:
         """
         if session_id in self.active_sessions:
             del self.active_sessions[session_id]
-            logger.info(f"Session revoked: {session_id}")
+            logger.info("Session revoked: %s", session_id)
 
     def refresh_session(self, token: str) -> Optional[Session]:
         """
@@ -141,17 +174,17 @@ class AuthManager:
             return None
 
         # Create new session with extended expiration
-        new_session_id = str(uuid.uuid4())
-        created_at = datetime.now()
-        expires_at = created_at + timedelta(hours=24)
+        new_session_id = uuid.uuid4().hex
+        created_at = int(time.time())
+        expires_at = created_at + SESSION_TTL
 
         payload = {
             "session_id": new_session_id,
             "user_id": current_session.user_id,
-            "exp": int(expires_at.timestamp())
+            "exp": expires_at
         }
 
-        new_token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        new_token = self._encode_token(payload)
 
         new_session = Session(
             session_id=new_session_id,
@@ -166,5 +199,5 @@ class AuthManager:
         self.revoke_session(current_session.session_id)
         self.active_sessions[new_session_id] = new_session
 
-        logger.info(f"Session refreshed for user: {current_session.user_id}")
+        logger.info("Session refreshed for user: %s", current_session.user_id)
         return new_session
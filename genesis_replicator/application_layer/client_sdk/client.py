@@ -3,14 +3,16 @@ Client SDK Module
 
 Main client interface for the Genesis Replicator Framework.
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
+import asyncio
 import logging
-import requests
+import threading
+import aiohttp
+import orjson
 from datetime import datetime
 from .auth import AuthManager, Session
+from .exceptions import APIError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ClientSDK:
@@ -19,7 +21,11 @@ class ClientSDK:
     def __init__(
         self,
         base_url: str = "http://localhost:8000",
-        auth_manager: Optional[AuthManager] = None
+        auth_manager: Optional[AuthManager] = None,
+        pool_size: int = 20,
+        pool_keepalive: int = 30,
+        dns_cache_ttl: int = 300,
+        http2: bool = False
     ):
         """
         Initialize the ClientSDK.
@@ -27,12 +33,137 @@ class ClientSDK:
         Args:
             base_url: Base URL for API endpoints
             auth_manager: Optional custom auth manager
+            pool_size: Maximum number of pooled connections to the API
+            pool_keepalive: Seconds an idle pooled connection is kept open
+            dns_cache_ttl: Seconds resolved API host addresses are cached
+            http2: Multiplex requests over HTTP/2 using httpx (requires
+                the ``httpx[http2]`` extra)
         """
         self.base_url = base_url.rstrip('/')
+        # Endpoint prefix built once instead of on every request
+        self._agents_url = f"{self.base_url}/agents"
         self.auth_manager = auth_manager or AuthManager()
         self.session: Optional[Session] = None
+        self._cached_headers: Dict[str, str] = {}
+        self.pool_size = pool_size
+        self.pool_keepalive = pool_keepalive
+        self.dns_cache_ttl = dns_cache_ttl
+        self.http2 = http2
+
+        # Created lazily so they bind to the running event loop, and
+        # recreated when used from a different one
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._httpx = None
+        self._httpx_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info("Client SDK initialized")
 
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session for the running event loop.
+
+        A session is bound to the loop it was created on, so a client that
+        outlives its loop (e.g. the shared client across asyncio.run calls)
+        gets a fresh session instead of one tied to a closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            self._http_loop = loop
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    limit_per_host=self.pool_size,
+                    keepalive_timeout=self.pool_keepalive,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    force_close=False
+                ),
+                headers={"Content-Type": "application/json"}
+            )
+        return self._http
+
+    def _get_httpx(self):
+        """Get the HTTP/2 client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._httpx is None or self._httpx.is_closed or self._httpx_loop is not loop:
+            import httpx
+            self._httpx_loop = loop
+            self._httpx = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.pool_keepalive
+                ),
+                timeout=httpx.Timeout(10.0),
+                headers={"Content-Type": "application/json"}
+            )
+        return self._httpx
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        error_message: str,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Send an API request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            error_message: Message logged when the request fails
+            **kwargs: Request options (json, params)
+
+        Returns:
+            Decoded response body
+
+        Raises:
+            APIError: If the request fails
+        """
+        headers = self._get_headers()
+        if self.http2:
+            import httpx
+            try:
+                response = await self._get_httpx().request(
+                    method, url, headers=headers, **kwargs
+                )
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            except httpx.HTTPError as e:
+                logger.error("%s: %s", error_message, e)
+                status = getattr(getattr(e, "response", None), "status_code", 0)
+                raise APIError(str(e), status) from e
+
+        try:
+            async with self._get_http().request(
+                method, url, headers=headers, **kwargs
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except aiohttp.ClientError as e:
+            logger.error("%s: %s", error_message, e)
+            raise APIError(str(e), getattr(e, "status", 0)) from e
+
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections."""
+        loop = asyncio.get_running_loop()
+        # Clients from an earlier loop cannot be closed from this one
+        if (self._http is not None and not self._http.closed
+                and self._http_loop is loop):
+            await self._http.close()
+        self._http = None
+        self._http_loop = None
+        if self._httpx is not None and self._httpx_loop is loop:
+            await self._httpx.aclose()
+        self._httpx = None
+        self._httpx_loop = None
+
+    async def __aenter__(self) -> "ClientSDK":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """
         Authenticate with the framework.
@@ -44,14 +175,22 @@ class ClientSDK:
             True if authentication successful, False otherwise
         """
         self.session = self.auth_manager.authenticate(credentials)
+        self._update_headers()
         return self.session is not None
 
+    def _update_headers(self) -> None:
+        """Rebuild the cached per-request headers for the current session."""
+        if self.session:
+            self._cached_headers = {
+                "Authorization": f"Bearer {self.session.token}"
+            }
+        else:
+            self._cached_headers = {}
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
-        headers = {"Content-Type": "application/json"}
-        if self.session:
-            headers["Authorization"] = f"Bearer {self.session.token}"
-        return headers
+        # Content-Type is set once on the HTTP session itself
+        return self._cached_headers
 
     async def create_agent(
         self,
@@ -65,21 +204,19 @@ class ClientSDK:
 
         Returns:
             Created agent details
+
+        Raises:
+            APIError: If the request fails
         """
         if not self.session:
             raise ValueError("Not authenticated")
 
-        try:
-            response = requests.post(
-                f"{self.base_url}/agents",
-                json=agent_config,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to create agent: {str(e)}")
-            raise
+        return await self._request(
+            "POST",
+            self._agents_url,
+            "Failed to create agent",
+            json=agent_config
+        )
 
     async def get_agent_status(self, agent_id: str) -> Dict[str, Any]:
         """
@@ -90,20 +227,49 @@ class ClientSDK:
 
         Returns:
             Agent status information
+
+        Raises:
+            APIError: If the request fails
         """
         if not self.session:
             raise ValueError("Not authenticated")
 
-        try:
-            response = requests.get(
-                f"{self.base_url}/agents/{agent_id}",
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get agent status: {str(e)}")
-            raise
+        return await self._request(
+            "GET",
+            f"{self._agents_url}/{agent_id}",
+            "Failed to get agent status"
+        )
+
+    async def get_agent_statuses(
+        self,
+        agent_ids: List[str]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Get status of several agents concurrently.
+
+        Requests are issued in parallel, bounded by the connection pool
+        size. A failed lookup does not cancel the others; its exception is
+        returned in place of the status.
+
+        Args:
+            agent_ids: IDs of the agents
+
+        Returns:
+            Agent status information or exception, in the order of agent_ids
+        """
+        if not self.session:
+            raise ValueError("Not authenticated")
+
+        semaphore = asyncio.Semaphore(self.pool_size)
+
+        async def fetch(agent_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_agent_status(agent_id)
+
+        return await asyncio.gather(
+            *(fetch(agent_id) for agent_id in agent_ids),
+            return_exceptions=True
+        )
 
     async def update_agent_config(
         self,
@@ -119,21 +285,19 @@ class ClientSDK:
 
         Returns:
             Updated agent configuration
+
+        Raises:
+            APIError: If the request fails
         """
         if not self.session:
             raise ValueError("Not authenticated")
 
-        try:
-            response = requests.patch(
-                f"{self.base_url}/agents/{agent_id}/config",
-                json=config_updates,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to update agent config: {str(e)}")
-            raise
+        return await self._request(
+            "PATCH",
+            f"{self._agents_url}/{agent_id}/config",
+            "Failed to update agent config",
+            json=config_updates
+        )
 
     async def list_agents(
         self,
@@ -147,21 +311,19 @@ class ClientSDK:
 
         Returns:
             List of matching agents
+
+        Raises:
+            APIError: If the request fails
         """
         if not self.session:
             raise ValueError("Not authenticated")
 
-        try:
-            response = requests.get(
-                f"{self.base_url}/agents",
-                params=filters,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list agents: {str(e)}")
-            raise
+        return await self._request(
+            "GET",
+            self._agents_url,
+            "Failed to list agents",
+            params=filters
+        )
 
     def refresh_auth(self) -> bool:
         """
@@ -176,6 +338,7 @@ class ClientSDK:
         new_session = self.auth_manager.refresh_session(self.session.token)
         if new_session:
             self.session = new_session
+            self._update_headers()
             return True
         return False
 
@@ -184,4 +347,34 @@ class ClientSDK:
         if self.session:
             self.auth_manager.revoke_session(self.session.session_id)
             self.session = None
+            self._update_headers()
             logger.info("Logged out successfully")
+
+
+# Shared client so modules importing the SDK reuse one connection pool
+_default_client: Optional[ClientSDK] = None
+_default_client_lock = threading.Lock()
+
+def get_default_client(
+    base_url: str = "http://localhost:8000",
+    **kwargs: Any
+) -> ClientSDK:
+    """
+    Get the process-wide shared ClientSDK, creating it on first use.
+
+    Arguments are only applied when the shared client is created. Construct
+    ClientSDK directly for an isolated client, e.g. in tests.
+
+    Args:
+        base_url: Base URL for API endpoints
+        **kwargs: Additional ClientSDK constructor arguments
+
+    Returns:
+        Shared ClientSDK instance
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = ClientSDK(base_url, **kwargs)
+    return _default_client
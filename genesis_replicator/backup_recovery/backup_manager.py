@@ -2,15 +2,29 @@
 Backup Manager for handling system-wide backups.
 """
 import asyncio
-import json
+import contextlib
+import io
 import logging
 import os
+import tarfile
+import time
+import uuid
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
+import zstandard
+
 logger = logging.getLogger(__name__)
 
+# Component data of a backup is streamed into this single archive
+ARCHIVE_NAME = "components.tar.zst"
+
+# Newline-delimited metadata of all backups, so listing reads one file
+INDEX_NAME = "_index.ndjson"
+
 class BackupManager:
     """Manages system-wide backups including state, configuration, and models."""
 
@@ -22,7 +36,18 @@ class BackupManager:
         """
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self._backup_lock = asyncio.Lock()
+        # Weakly held, so a component's lock goes away when no backup uses it
+        self._component_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._index_lock = asyncio.Lock()
+
+    def _lock_for(self, component: str) -> asyncio.Lock:
+        """Get the lock guarding backups of a single component."""
+        lock = self._component_locks.get(component)
+        if lock is None:
+            lock = self._component_locks[component] = asyncio.Lock()
+        return lock
 
     async def create_backup(self, components: List[str]) -> str:
         """Create a new backup of specified components.
@@ -33,14 +58,26 @@ class BackupManager:
         Returns:
             Backup ID
         """
-        async with self._backup_lock:
-            backup_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        async with contextlib.AsyncExitStack() as stack:
+            # Lock only the components involved, in a fixed order so
+            # overlapping backups cannot deadlock
+            for component in sorted(set(components)):
+                await stack.enter_async_context(self._lock_for(component))
+
+            # Nanosecond time keeps IDs sortable; the random suffix keeps
+            # concurrent backups from colliding
+            backup_id = f"{time.time_ns():020d}_{uuid.uuid4().hex[:8]}"
             backup_path = self.backup_dir / backup_id
-            backup_path.mkdir()
+            await asyncio.to_thread(backup_path.mkdir)
 
             try:
+                entries: Dict[str, Dict[str, bytes]] = {}
                 for component in components:
-                    await self._backup_component(component, backup_path)
+                    entries[component] = await self._backup_component(component)
+
+                await asyncio.to_thread(
+                    self._write_archive, backup_path / ARCHIVE_NAME, entries
+                )
 
                 # Create backup metadata
                 metadata = {
@@ -50,13 +87,16 @@ class BackupManager:
                     "status": "completed"
                 }
 
-                with open(backup_path / "metadata.json", "w") as f:
-                    json.dump(metadata, f, indent=2)
+                await asyncio.to_thread(
+                    self._write_metadata, backup_path, metadata
+                )
+                async with self._index_lock:
+                    await asyncio.to_thread(self._append_index, metadata)
 
                 return backup_id
 
             except Exception as e:
-                logger.error(f"Backup failed: {str(e)}")
+                logger.error("Backup failed: %s", e)
                 raise
 
     async def restore_backup(self, backup_id: str, components: Optional[List[str]] = None) -> bool:
@@ -70,13 +110,12 @@ class BackupManager:
             Success status
         """
         backup_path = self.backup_dir / backup_id
-        if not backup_path.exists():
+        if not await asyncio.to_thread(backup_path.exists):
             raise ValueError(f"Backup {backup_id} not found")
 
         try:
             # Read backup metadata
-            with open(backup_path / "metadata.json") as f:
-                metadata = json.load(f)
+            metadata = await asyncio.to_thread(self._read_metadata, backup_path)
 
             # Determine components to restore
             restore_components = components or metadata["components"]
@@ -86,14 +125,27 @@ class BackupManager:
                 if component not in metadata["components"]:
                     raise ValueError(f"Component {component} not found in backup")
 
+            archive_path = backup_path / ARCHIVE_NAME
+            if await asyncio.to_thread(archive_path.exists):
+                archive = await asyncio.to_thread(
+                    self._read_archive, archive_path, set(restore_components)
+                )
+            else:
+                # Backups predating the archive keep one directory per component
+                archive = await asyncio.to_thread(
+                    self._read_component_dirs, backup_path, set(restore_components)
+                )
+
             # Perform restoration
             for component in restore_components:
-                await self._restore_component(component, backup_path)
+                if component not in archive:
+                    raise ValueError(f"Component {component} not found in backup")
+                await self._restore_component(component, archive[component])
 
             return True
 
         except Exception as e:
-            logger.error(f"Restore failed: {str(e)}")
+            logger.error("Restore failed: %s", e)
             raise
 
     async def list_backups(self) -> List[Dict]:
@@ -102,85 +154,184 @@ class BackupManager:
         Returns:
             List of backup metadata
         """
+        async with self._index_lock:
+            backups = await asyncio.to_thread(self._read_index)
+        # Sort on the stored timestamp: legacy YYYYmmdd_HHMMSS IDs do not
+        # order against nanosecond IDs; the ID only breaks ties
+        backups.sort(key=lambda x: (x["timestamp"], x["backup_id"]), reverse=True)
+        return backups
+
+    def _scan_backups(self) -> List[Dict]:
+        """Read metadata of every backup directory (blocking)."""
         backups = []
         for backup_dir in self.backup_dir.iterdir():
             if backup_dir.is_dir():
                 try:
-                    with open(backup_dir / "metadata.json") as f:
-                        metadata = json.load(f)
-                        backups.append(metadata)
+                    backups.append(self._read_metadata(backup_dir))
                 except Exception as e:
-                    logger.warning(f"Failed to read backup metadata: {str(e)}")
+                    logger.warning("Failed to read backup metadata: %s", e)
+        return backups
 
-        return sorted(backups, key=lambda x: x["timestamp"], reverse=True)
-
-    async def _backup_component(self, component: str, backup_path: Path) -> None:
+    def _read_index(self) -> List[Dict]:
+        """Read backup metadata from the index, rebuilding it if missing (blocking)."""
+        index_path = self.backup_dir / INDEX_NAME
+        try:
+            with open(index_path, "rb") as f:
+                return [orjson.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            backups = self._scan_backups()
+            self._write_index(backups)
+            return backups
+
+    def _append_index(self, metadata: Dict) -> None:
+        """Record a new backup in the index (blocking)."""
+        index_path = self.backup_dir / INDEX_NAME
+        if not index_path.exists():
+            # First indexed backup: include backups created before the index
+            self._write_index(self._scan_backups())
+            return
+        with open(index_path, "ab") as f:
+            f.write(orjson.dumps(metadata) + b"\n")
+
+    def _write_index(self, backups: List[Dict]) -> None:
+        """Atomically rewrite the index (blocking)."""
+        index_path = self.backup_dir / INDEX_NAME
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.writelines(orjson.dumps(metadata) + b"\n" for metadata in backups)
+        os.replace(tmp_path, index_path)
+
+    @staticmethod
+    def _write_metadata(backup_path: Path, metadata: Dict) -> None:
+        """Write backup metadata to disk (blocking)."""
+        with open(backup_path / "metadata.json", "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+
+    @staticmethod
+    def _read_metadata(backup_path: Path) -> Dict:
+        """Read backup metadata from disk (blocking)."""
+        with open(backup_path / "metadata.json", "rb") as f:
+            return orjson.loads(f.read())
+
+    @staticmethod
+    def _write_archive(path: Path, entries: Dict[str, Dict[str, bytes]]) -> None:
+        """Stream component files into a zstd-compressed tar (blocking).
+
+        Each component is stored as a directory entry followed by its files,
+        so components without files are still recorded in the archive.
+        """
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(path, "wb") as raw, cctx.stream_writer(raw) as compressed:
+            with tarfile.open(fileobj=compressed, mode="w|") as tar:
+                for component, files in entries.items():
+                    info = tarfile.TarInfo(component)
+                    info.type = tarfile.DIRTYPE
+                    tar.addfile(info)
+                    for name, data in files.items():
+                        info = tarfile.TarInfo(f"{component}/{name}")
+                        info.size = len(data)
+                        tar.addfile(info, io.BytesIO(data))
+
+    @staticmethod
+    def _read_archive(
+        path: Path,
+        components: set
+    ) -> Dict[str, Dict[str, bytes]]:
+        """Read files of the given components from a backup archive (blocking)."""
+        archive: Dict[str, Dict[str, bytes]] = {}
+        dctx = zstandard.ZstdDecompressor()
+        with open(path, "rb") as raw, dctx.stream_reader(raw) as compressed:
+            with tarfile.open(fileobj=compressed, mode="r|") as tar:
+                for member in tar:
+                    component, _, name = member.name.partition("/")
+                    if component not in components:
+                        continue
+                    files = archive.setdefault(component, {})
+                    fileobj = tar.extractfile(member) if member.isfile() else None
+                    if fileobj is not None:
+                        files[name] = fileobj.read()
+        return archive
+
+    @staticmethod
+    def _read_component_dirs(
+        backup_path: Path,
+        components: set
+    ) -> Dict[str, Dict[str, bytes]]:
+        """Read files of the given components from a legacy backup (blocking)."""
+        archive: Dict[str, Dict[str, bytes]] = {}
+        for component in components:
+            component_path = backup_path / component
+            if not component_path.is_dir():
+                continue
+            archive[component] = {
+                path.relative_to(component_path).as_posix(): path.read_bytes()
+                for path in component_path.rglob("*")
+                if path.is_file()
+            }
+        return archive
+
+    async def _backup_component(self, component: str) -> Dict[str, bytes]:
         """Backup a specific component.
 
         Args:
             component: Component name
-            backup_path: Path to store backup
-        """
-        component_path = backup_path / component
-        component_path.mkdir()
 
+        Returns:
+            Archive file names mapped to their contents
+        """
         # Component-specific backup logic
         if component == "state":
-            await self._backup_state(component_path)
+            return await self._backup_state()
         elif component == "config":
-            await self._backup_config(component_path)
+            return await self._backup_config()
         elif component == "models":
-            await self._backup_models(component_path)
+            return await self._backup_models()
         else:
             raise ValueError(f"Unknown component: {component}")
 
-    async def _restore_component(self, component: str, backup_path: Path) -> None:
+    async def _restore_component(self, component: str, files: Dict[str, bytes]) -> None:
         """Restore a specific component.
 
         Args:
             component: Component name
-            backup_path: Path to backup
+            files: Archive file names mapped to their contents
         """
-        component_path = backup_path / component
-        if not component_path.exists():
-            raise ValueError(f"Component {component} not found in backup")
-
         # Component-specific restore logic
         if component == "state":
-            await self._restore_state(component_path)
+            await self._restore_state(files)
         elif component == "config":
-            await self._restore_config(component_path)
+            await self._restore_config(files)
         elif component == "models":
-            await self._restore_models(component_path)
+            await self._restore_models(files)
         else:
             raise ValueError(f"Unknown component: {component}")
 
-    async def _backup_state(self, path: Path) -> None:
+    async def _backup_state(self) -> Dict[str, bytes]:
         """Backup system state."""
         # Implementation for state backup
-        pass
+        return {}
 
-    async def _backup_config(self, path: Path) -> None:
+    async def _backup_config(self) -> Dict[str, bytes]:
         """Backup configuration."""
         # Implementation for config backup
-        pass
+        return {}
 
-    async def _backup_models(self, path: Path) -> None:
+    async def _backup_models(self) -> Dict[str, bytes]:
         """Backup AI models."""
         # Implementation for model backup
-        pass
+        return {}
 
-    async def _restore_state(self, path: Path) -> None:
+    async def _restore_state(self, files: Dict[str, bytes]) -> None:
         """Restore system state."""
         # Implementation for state restore
         pass
 
-    async def _restore_config(self, path: Path) -> None:
+    async def _restore_config(self, files: Dict[str, bytes]) -> None:
         """Restore configuration."""
         # Implementation for config restore
         pass
 
-    async def _restore_models(self, path: Path) -> None:
+    async def _restore_models(self, files: Dict[str, bytes]) -> None:
         """Restore AI models."""
         # Implementation for model restore
         pass
@@ -42,6 +42,9 @@ class RecoveryProcedure:
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.error: Optional[str] = None
+        # Serializes runs of this procedure only; unrelated procedures
+        # may execute concurrently
+        self.lock = asyncio.Lock()
 
 class RecoveryManager:
     """Manages system recovery procedures."""
@@ -49,7 +52,11 @@ class RecoveryManager:
     def __init__(self):
         """Initialize the recovery manager."""
         self._procedures: Dict[str, RecoveryProcedure] = {}
-        self._recovery_lock = asyncio.Lock()
+        # Procedure names by bit position used in dependency bitmasks
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        # Cached execution levels, invalidated when procedures change
+        self._levels: Optional[List[List[str]]] = None
 
     def register_procedure(
         self,
@@ -76,6 +83,9 @@ class RecoveryManager:
             timeout=timeout
         )
         self._procedures[name] = procedure
+        self._index[name] = len(self._names)
+        self._names.append(name)
+        self._levels = None
 
     async def execute_procedure(self, name: str) -> bool:
         """Execute a recovery procedure.
@@ -98,7 +108,7 @@ class RecoveryManager:
             if self._procedures[dep].status != RecoveryStatus.COMPLETED:
                 raise ValueError(f"Dependency {dep} not completed")
 
-        async with self._recovery_lock:
+        async with procedure.lock:
             try:
                 procedure.status = RecoveryStatus.IN_PROGRESS
                 procedure.start_time = datetime.now()
@@ -120,7 +130,7 @@ class RecoveryManager:
             except Exception as e:
                 procedure.error = str(e)
                 procedure.status = RecoveryStatus.FAILED
-                logger.error(f"Recovery procedure failed: {str(e)}")
+                logger.error("Recovery procedure failed: %s", e)
                 return False
 
             finally:
@@ -129,46 +139,71 @@ class RecoveryManager:
     async def execute_all(self) -> bool:
         """Execute all recovery procedures in dependency order.
 
+        Procedures whose dependencies are all satisfied run concurrently.
+
         Returns:
             Overall success status
         """
-        # Build dependency graph
-        graph = {name: proc.dependencies for name, proc in self._procedures.items()}
+        if self._levels is None:
+            self._levels = self._resolve_levels()
+
+        # Execute each level once the previous one has completed
+        for level in self._levels:
+            results = await asyncio.gather(
+                *(self.execute_procedure(name) for name in level)
+            )
+            if not all(results):
+                return False
+
+        return True
+
+    def _resolve_levels(self) -> List[List[str]]:
+        """Group procedures into levels so dependencies run first.
 
-        # Topological sort
-        visited = set()
-        temp = set()
-        order = []
+        Every procedure in a level depends only on procedures in earlier
+        levels, so a level can be executed concurrently.
 
-        def visit(name: str):
-            if name in temp:
+        Returns:
+            Procedure names grouped by execution level
+
+        Raises:
+            ValueError: If a dependency is missing or circular
+        """
+        # Bit j of deps_mask[i] is set when procedure i depends on procedure j
+        deps_mask = []
+        for name in self._names:
+            mask = 0
+            for dep in self._procedures[name].dependencies:
+                if dep not in self._index:
+                    raise ValueError(f"Dependency {dep} not found")
+                mask |= 1 << self._index[dep]
+            deps_mask.append(mask)
+
+        levels = []
+        done = 0
+        remaining = (1 << len(self._names)) - 1
+        while remaining:
+            level_mask = 0
+            pending = remaining
+            while pending:
+                bit = pending & -pending
+                pending ^= bit
+                if not deps_mask[bit.bit_length() - 1] & ~done:
+                    level_mask |= bit
+            if not level_mask:
                 raise ValueError("Circular dependency detected")
-            if name in visited:
-                return
-
-            temp.add(name)
-            for dep in graph[name]:
-                visit(dep)
-            temp.remove(name)
-            visited.add(name)
-            order.append(name)
-
-        try:
-            for name in graph:
-                if name not in visited:
-                    visit(name)
-        except ValueError as e:
-            logger.error(f"Dependency resolution failed: {str(e)}")
-            return False
-
-        # Execute procedures in order
-        success = True
-        for name in order:
-            if not await self.execute_procedure(name):
-                success = False
-                break
-
-        return success
+
+            level = []
+            pending = level_mask
+            while pending:
+                bit = pending & -pending
+                pending ^= bit
+                level.append(self._names[bit.bit_length() - 1])
+            levels.append(level)
+            done |= level_mask
+            remaining &= ~level_mask
+
+        return levels
 
     def get_procedure_status(self, name: str) -> RecoveryStatus:
         """Get status of a recovery procedure.
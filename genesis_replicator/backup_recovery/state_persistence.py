@@ -2,26 +2,78 @@
 State Persistence Manager for maintaining system state.
 """
 import asyncio
-import json
 import logging
+import os
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 class StatePersistenceManager:
     """Manages persistence of system state."""
 
-    def __init__(self, state_dir: str = "state"):
+    def __init__(
+        self,
+        state_dir: str = "state",
+        max_cache_entries: int = 1024,
+        cache_ttl: float = 300.0
+    ):
         """Initialize the state persistence manager.
 
+        Cached state objects are shared with callers and must be treated
+        as read-only; save a new dict to change a component's state.
+
         Args:
             state_dir: Directory to store state files
+            max_cache_entries: Maximum number of components kept in memory
+            cache_ttl: Seconds a cached state is served before re-reading disk
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
-        self._state_lock = asyncio.Lock()
-        self._state_cache: Dict[str, Any] = {}
+        self.max_cache_entries = max_cache_entries
+        self.cache_ttl = cache_ttl
+        # Only locks in use are kept alive
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # component -> (state, hash of serialized state or None, cached at)
+        self._state_cache: "OrderedDict[str, Tuple[Dict, Optional[int], float]]" = (
+            OrderedDict()
+        )
+
+    def _lock_for(self, component: str) -> asyncio.Lock:
+        """Get the lock guarding a single component's state.
+
+        Runs without awaiting, so the lookup-or-create is atomic on the
+        event loop and needs no guard lock of its own.
+        """
+        lock = self._locks.get(component)
+        if lock is None:
+            lock = self._locks[component] = asyncio.Lock()
+        return lock
+
+    def _cache_get(self, component: str) -> Optional[Tuple[Dict, Optional[int], float]]:
+        """Get a live cache entry, dropping it if it has expired."""
+        entry = self._state_cache.get(component)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[2] > self.cache_ttl:
+            del self._state_cache[component]
+            return None
+        self._state_cache.move_to_end(component)
+        return entry
+
+    def _cache_put(self, component: str, state: Dict, digest: Optional[int]) -> None:
+        """Cache a component state, evicting the least recently used entry."""
+        self._state_cache[component] = (state, digest, time.monotonic())
+        self._state_cache.move_to_end(component)
+        while len(self._state_cache) > self.max_cache_entries:
+            self._state_cache.popitem(last=False)
 
     async def save_state(self, component: str, state: Dict) -> bool:
         """Save component state to disk.
@@ -33,21 +85,35 @@ class StatePersistenceManager:
         Returns:
             Success status
         """
-        async with self._state_lock:
+        async with self._lock_for(component):
             try:
                 state_file = self.state_dir / f"{component}.json"
-
-                # Update cache
-                self._state_cache[component] = state
+                # Non-string keys are stringified, as json.dump did
+                data = orjson.dumps(
+                    state,
+                    option=(
+                        orjson.OPT_INDENT_2
+                        | orjson.OPT_SORT_KEYS
+                        | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+                digest = hash(data)
+
+                # Skip the disk write when the state is unchanged
+                cached = self._cache_get(component)
+                if cached is not None and cached[1] == digest:
+                    self._cache_put(component, state, digest)
+                    return True
 
                 # Write to disk
-                with open(state_file, "w") as f:
-                    json.dump(state, f, indent=2)
+                await asyncio.to_thread(self._write_state, state_file, data)
 
+                # Update cache
+                self._cache_put(component, state, digest)
                 return True
 
             except Exception as e:
-                logger.error(f"Failed to save state for {component}: {str(e)}")
+                logger.error("Failed to save state for %s: %s", component, e)
                 return False
 
     async def load_state(self, component: str) -> Optional[Dict]:
@@ -60,24 +126,23 @@ class StatePersistenceManager:
             State data or None if not found
         """
         # Check cache first
-        if component in self._state_cache:
-            return self._state_cache[component]
+        cached = self._cache_get(component)
+        if cached is not None:
+            return cached[0]
 
-        async with self._state_lock:
+        async with self._lock_for(component):
             try:
                 state_file = self.state_dir / f"{component}.json"
-                if not state_file.exists():
+                state = await asyncio.to_thread(self._read_state, state_file)
+                if state is None:
                     return None
 
-                with open(state_file) as f:
-                    state = json.load(f)
-
                 # Update cache
-                self._state_cache[component] = state
+                self._cache_put(component, state, None)
                 return state
 
             except Exception as e:
-                logger.error(f"Failed to load state for {component}: {str(e)}")
+                logger.error("Failed to load state for %s: %s", component, e)
                 return None
 
     async def delete_state(self, component: str) -> bool:
@@ -89,18 +154,17 @@ class StatePersistenceManager:
         Returns:
             Success status
         """
-        async with self._state_lock:
+        async with self._lock_for(component):
             try:
                 state_file = self.state_dir / f"{component}.json"
-                if state_file.exists():
-                    state_file.unlink()
+                await asyncio.to_thread(state_file.unlink, missing_ok=True)
 
                 # Remove from cache
                 self._state_cache.pop(component, None)
                 return True
 
             except Exception as e:
-                logger.error(f"Failed to delete state for {component}: {str(e)}")
+                logger.error("Failed to delete state for %s: %s", component, e)
                 return False
 
     async def list_components(self) -> list:
@@ -109,12 +173,34 @@ class StatePersistenceManager:
         Returns:
             List of component identifiers
         """
-        components = []
-        for state_file in self.state_dir.glob("*.json"):
-            components.append(state_file.stem)
-        return components
+        state_files = await asyncio.to_thread(
+            lambda: list(self.state_dir.glob("*.json"))
+        )
+        return [state_file.stem for state_file in state_files]
+
+    @staticmethod
+    def _write_state(state_file: Path, data: bytes) -> None:
+        """Atomically write serialized state to disk (blocking).
+
+        Data goes to a temporary file that replaces the state file only
+        once fully flushed, so a crash never leaves a torn state file.
+        """
+        tmp_file = state_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, state_file)
+
+    @staticmethod
+    def _read_state(state_file: Path) -> Optional[Dict]:
+        """Read state from disk, returning None if missing (blocking)."""
+        try:
+            with open(state_file, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
 
     async def clear_cache(self) -> None:
         """Clear the state cache."""
-        async with self._state_lock:
-            self._state_cache.clear()
+        self._state_cache.clear()
@@ -3,18 +3,21 @@ Cross-chain transaction manager for coordinating multi-chain operations.
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 
 from ..foundation_services.blockchain_integration.chain_manager import ChainManager
 from ..foundation_services.blockchain_integration.transaction_manager import TransactionManager
-from ..security.contract_security import ContractSecurity
+from ..security.contract_security import ContractSecurityManager
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Bound once so ID generation skips the module attribute lookup
+_new_id_hash = hashlib.blake2b
+
+@dataclass(slots=True)
 class CrossChainTransaction:
     """Represents a cross-chain transaction."""
     transaction_id: str
@@ -35,7 +38,8 @@ class CrossChainManager:
         self,
         chain_manager: ChainManager,
         transaction_manager: TransactionManager,
-        contract_security: ContractSecurity
+        contract_security: ContractSecurityManager,
+        confirmation_timeout: float = 1800.0
     ):
         """Initialize cross-chain manager.
 
@@ -43,13 +47,19 @@ class CrossChainManager:
             chain_manager: Chain manager instance
             transaction_manager: Transaction manager instance
             contract_security: Contract security instance
+            confirmation_timeout: Maximum seconds to wait for a transaction
+                to reach its required confirmations
         """
         self._chain_manager = chain_manager
         self._transaction_manager = transaction_manager
         self._contract_security = contract_security
         self._transactions: Dict[str, CrossChainTransaction] = {}
-        self._lock = asyncio.Lock()
-        self._pending_confirmations: Dict[str, Set[str]] = {}
+        # chain -> tx hash -> [(required confirmations, future)]
+        self._confirmation_waiters: Dict[
+            str, Dict[str, List[Tuple[int, asyncio.Future]]]
+        ] = {}
+        self._confirmation_watchers: Dict[str, asyncio.Task] = {}
+        self._confirmation_timeout = confirmation_timeout
         logger.info("Cross-chain manager initialized")
 
     async def initiate_cross_chain_transaction(
@@ -83,9 +93,14 @@ class CrossChainManager:
             if not await self._chain_manager.is_chain_supported(target_chain):
                 raise ValueError(f"Target chain {target_chain} not supported")
 
-            # Generate transaction ID
+            # Generate transaction ID. It is only a correlation key, not a
+            # security token, so a 64-bit BLAKE2b digest is sufficient and
+            # yields exactly 16 hex characters without truncation
             tx_data = f"{source_chain}-{target_chain}-{datetime.now().isoformat()}"
-            transaction_id = hashlib.sha256(tx_data.encode()).hexdigest()[:16]
+            transaction_id = _new_id_hash(
+                tx_data.encode(),
+                digest_size=8
+            ).hexdigest()
 
             # Create transaction record
             transaction = CrossChainTransaction(
@@ -101,22 +116,22 @@ class CrossChainManager:
                 confirmations={source_chain: 0, target_chain: 0}
             )
 
-            async with self._lock:
-                self._transactions[transaction_id] = transaction
-                if dependencies:
-                    for dep_id in dependencies:
-                        if dep_id not in self._transactions:
-                            raise ValueError(f"Dependency {dep_id} not found")
-
             # Validate and prepare transactions
             await self._validate_transactions(transaction)
             await self._prepare_transactions(transaction)
 
-            logger.info(f"Initiated cross-chain transaction: {transaction_id}")
+            # Dependency check and registration run with no await between
+            # them, so they are atomic on the event loop without a lock
+            for dep_id in transaction.dependencies:
+                if dep_id not in self._transactions:
+                    raise ValueError(f"Dependency {dep_id} not found")
+            self._transactions[transaction_id] = transaction
+
+            logger.info("Initiated cross-chain transaction: %s", transaction_id)
             return transaction_id
 
         except Exception as e:
-            logger.error(f"Failed to initiate cross-chain transaction: {str(e)}")
+            logger.error("Failed to initiate cross-chain transaction: %s", e)
             raise
 
     async def execute_transaction(
@@ -132,10 +147,10 @@ class CrossChainManager:
             ValueError: If transaction not found
             RuntimeError: If execution fails
         """
-        if transaction_id not in self._transactions:
+        transaction = self._transactions.get(transaction_id)
+        if transaction is None:
             raise ValueError(f"Transaction {transaction_id} not found")
 
-        transaction = self._transactions[transaction_id]
         try:
             # Check dependencies
             for dep_id in transaction.dependencies:
@@ -168,17 +183,15 @@ class CrossChainManager:
             )
 
             # Update transaction status
-            async with self._lock:
-                transaction.status = "completed"
-                transaction.updated_at = datetime.now()
+            transaction.status = "completed"
+            transaction.updated_at = datetime.now()
 
-            logger.info(f"Completed cross-chain transaction: {transaction_id}")
+            logger.info("Completed cross-chain transaction: %s", transaction_id)
 
         except Exception as e:
-            logger.error(f"Failed to execute transaction {transaction_id}: {str(e)}")
-            async with self._lock:
-                transaction.status = "failed"
-                transaction.updated_at = datetime.now()
+            logger.error("Failed to execute transaction %s: %s", transaction_id, e)
+            transaction.status = "failed"
+            transaction.updated_at = datetime.now()
             raise RuntimeError(f"Transaction execution failed: {str(e)}")
 
     async def get_transaction_status(
@@ -219,16 +232,16 @@ class CrossChainManager:
         Raises:
             ValueError: If validation fails
         """
-        # Validate source transaction
-        await self._contract_security.validate_transaction(
-            transaction.source_chain,
-            transaction.source_tx
-        )
-
-        # Validate target transaction
-        await self._contract_security.validate_transaction(
-            transaction.target_chain,
-            transaction.target_tx
+        # Source and target checks are independent, so run them concurrently
+        await asyncio.gather(
+            self._contract_security.validate_transaction(
+                transaction.source_chain,
+                transaction.source_tx
+            ),
+            self._contract_security.validate_transaction(
+                transaction.target_chain,
+                transaction.target_tx
+            )
         )
 
     async def _prepare_transactions(
@@ -244,20 +257,22 @@ class CrossChainManager:
             RuntimeError: If preparation fails
         """
         try:
-            # Prepare source transaction
-            transaction.source_tx = await self._transaction_manager.prepare_transaction(
-                transaction.source_chain,
-                transaction.source_tx
-            )
-
-            # Prepare target transaction
-            transaction.target_tx = await self._transaction_manager.prepare_transaction(
-                transaction.target_chain,
-                transaction.target_tx
+            # Prepare source and target transactions concurrently
+            source_tx, target_tx = await asyncio.gather(
+                self._transaction_manager.prepare_transaction(
+                    transaction.source_chain,
+                    transaction.source_tx
+                ),
+                self._transaction_manager.prepare_transaction(
+                    transaction.target_chain,
+                    transaction.target_tx
+                )
             )
+            transaction.source_tx = source_tx
+            transaction.target_tx = target_tx
 
         except Exception as e:
-            logger.error(f"Failed to prepare transactions: {str(e)}")
+            logger.error("Failed to prepare transactions: %s", e)
             raise RuntimeError(f"Transaction preparation failed: {str(e)}")
 
     async def _wait_for_confirmation(
@@ -274,19 +289,123 @@ class CrossChainManager:
             required_confirmations: Required number of confirmations
 
         Raises:
-            RuntimeError: If confirmation fails
+            RuntimeError: If confirmation fails or times out
         """
         try:
-            confirmations = 0
-            while confirmations < required_confirmations:
-                confirmations = await self._chain_manager.get_transaction_confirmations(
-                    chain,
-                    tx_hash
-                )
-                if confirmations >= required_confirmations:
-                    break
-                await asyncio.sleep(15)  # Wait for next block
+            await asyncio.wait_for(
+                self._await_confirmations(chain, tx_hash, required_confirmations),
+                timeout=self._confirmation_timeout
+            )
 
+        except asyncio.TimeoutError:
+            logger.error("Timed out waiting for confirmation of %s", tx_hash)
+            raise RuntimeError(
+                f"Transaction confirmation timed out after "
+                f"{self._confirmation_timeout}s"
+            )
         except Exception as e:
-            logger.error(f"Failed to get transaction confirmation: {str(e)}")
+            logger.error("Failed to get transaction confirmation: %s", e)
             raise RuntimeError(f"Transaction confirmation failed: {str(e)}")
+
+    async def _await_confirmations(
+        self,
+        chain: str,
+        tx_hash: str,
+        required_confirmations: int
+    ) -> None:
+        """Wait on the chain's shared watcher until enough confirmations.
+
+        Args:
+            chain: Chain identifier
+            tx_hash: Transaction hash
+            required_confirmations: Required number of confirmations
+        """
+        confirmations = await self._chain_manager.get_transaction_confirmations(
+            chain,
+            tx_hash
+        )
+        if confirmations >= required_confirmations:
+            return
+
+        waiter = (required_confirmations, asyncio.get_running_loop().create_future())
+        waiters = self._confirmation_waiters.setdefault(chain, {})
+        waiters.setdefault(tx_hash, []).append(waiter)
+
+        watcher = self._confirmation_watchers.get(chain)
+        if watcher is None or watcher.done():
+            self._confirmation_watchers[chain] = asyncio.create_task(
+                self._watch_confirmations(chain)
+            )
+
+        try:
+            await waiter[1]
+        finally:
+            pending = waiters.get(tx_hash)
+            if pending and waiter in pending:
+                pending.remove(waiter)
+                if not pending:
+                    del waiters[tx_hash]
+
+    async def _watch_confirmations(self, chain: str) -> None:
+        """Check every pending transaction on a chain once per new block.
+
+        One watcher serves all waiters on a chain, so N in-flight
+        transactions cost one confirmation query per hash per block rather
+        than one per waiter. Uses the chain manager's new-head subscription
+        when available and falls back to polling otherwise.
+
+        Args:
+            chain: Chain identifier
+        """
+        heads = None
+        try:
+            subscribe = getattr(self._chain_manager, "subscribe_new_head", None)
+            if asyncio.iscoroutinefunction(subscribe):
+                heads = await subscribe(chain)
+
+            waiters = self._confirmation_waiters.get(chain, {})
+            while waiters:
+                if heads is not None:
+                    await heads.get()
+                else:
+                    await asyncio.sleep(15)  # Wait for next block
+
+                tx_hashes = list(waiters)
+                results = await asyncio.gather(
+                    *(
+                        self._chain_manager.get_transaction_confirmations(chain, tx_hash)
+                        for tx_hash in tx_hashes
+                    ),
+                    return_exceptions=True
+                )
+
+                for tx_hash, result in zip(tx_hashes, results):
+                    remaining = []
+                    for required, future in waiters.get(tx_hash, ()):
+                        if future.done():
+                            continue
+                        if isinstance(result, BaseException):
+                            future.set_exception(result)
+                        elif result >= required:
+                            future.set_result(result)
+                        else:
+                            remaining.append((required, future))
+                    if remaining:
+                        waiters[tx_hash] = remaining
+                    else:
+                        waiters.pop(tx_hash, None)
+
+        except Exception as e:
+            logger.error("Confirmation watcher for %s failed: %s", chain, e)
+            for pending in self._confirmation_waiters.get(chain, {}).values():
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+        finally:
+            if self._confirmation_watchers.get(chain) is asyncio.current_task():
+                del self._confirmation_watchers[chain]
+            if not self._confirmation_waiters.get(chain):
+                self._confirmation_waiters.pop(chain, None)
+            if heads is not None:
+                await self._chain_manager.unsubscribe_new_head(chain, heads)
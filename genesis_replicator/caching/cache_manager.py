@@ -2,16 +2,38 @@
 Cache manager for handling distributed caching operations.
 """
 import asyncio
+import heapq
 import logging
+from collections import OrderedDict
 from typing import Any, Dict, Optional, List, Set, Tuple
-from datetime import datetime, timedelta
-import json
 import hashlib
+import sys
+import time
 
 logger = logging.getLogger(__name__)
 
+def _estimate_size(value: Any) -> int:
+    """Cheaply estimate the size of a cached value in bytes.
+
+    Containers are walked one level deep; nested values are counted by
+    their shallow size only.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
 class CacheEntry:
     """Represents a cached item with metadata."""
+    __slots__ = (
+        "key", "value", "created_at", "expires_at", "tags",
+        "access_count", "last_accessed", "approx_size"
+    )
+
     def __init__(
         self,
         key: str,
@@ -21,23 +43,41 @@ class CacheEntry:
     ):
         self.key = key
         self.value = value
-        self.created_at = datetime.now()
-        self.expires_at = self.created_at + timedelta(seconds=ttl)
+        # Monotonic seconds: cheap float compares, immune to clock changes
+        self.created_at = time.monotonic()
+        self.expires_at = self.created_at + ttl
         self.tags = tags
         self.access_count = 0
         self.last_accessed = self.created_at
+        # Computed once here so stats never re-walk cached values
+        self.approx_size = (
+            len(key.encode())
+            + _estimate_size(value)
+            + sum(len(tag.encode()) for tag in tags)
+            + 64  # Approximate size of timestamps and counters
+        )
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if entry is expired.
 
-    def is_expired(self) -> bool:
-        """Check if entry is expired."""
-        return datetime.now() > self.expires_at
+        Args:
+            now: Current monotonic time, so batch callers read the clock
+                only once
+        """
+        return (now if now is not None else time.monotonic()) > self.expires_at
 
     def update_access(self) -> None:
         """Update access statistics."""
         self.access_count += 1
-        self.last_accessed = datetime.now()
+        self.last_accessed = time.monotonic()
 
 class CacheManager:
-    """Manages distributed caching operations."""
+    """Manages distributed caching operations.
+
+    Operations never await while touching the cache, so they are atomic on
+    the owning event loop and need no lock. The manager must only be used
+    from that loop's thread.
+    """
 
     def __init__(
         self,
@@ -52,12 +92,15 @@ class CacheManager:
             default_ttl: Default time-to-live in seconds
             cleanup_interval: Cleanup interval in seconds
         """
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered least to most recently used
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._cleanup_interval = cleanup_interval
         self._tag_index: Dict[str, Set[str]] = {}
-        self._lock = asyncio.Lock()
+        # Min-heap of (expires_at, key); entries for keys since removed or
+        # re-set are skipped lazily and compacted when they pile up
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._cleanup_task: Optional[asyncio.Task] = None
         logger.info("Cache manager initialized")
 
@@ -90,17 +133,19 @@ class CacheManager:
         Returns:
             Cached value or default
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            if not entry:
-                return default
+        # No await between lookup and update, so this runs atomically on
+        # the event loop without taking a lock
+        entry = self._cache.get(key)
+        if not entry:
+            return default
 
-            if entry.is_expired():
-                await self._remove_entry(key)
-                return default
+        if entry.is_expired():
+            self._remove_entry(key)
+            return default
 
-            entry.update_access()
-            return entry.value
+        entry.update_access()
+        self._cache.move_to_end(key)
+        return entry.value
 
     async def set(
         self,
@@ -120,20 +165,26 @@ class CacheManager:
         ttl = ttl or self._default_ttl
         tags = tags or set()
 
-        async with self._lock:
-            # Check size limit
-            if len(self._cache) >= self._max_size:
-                await self._evict_entries()
+        # Replace any existing entry so its tags are unindexed and it moves
+        # to the most recently used end
+        self._remove_entry(key)
 
-            # Create entry
-            entry = CacheEntry(key, value, ttl, tags)
-            self._cache[key] = entry
+        # Check size limit
+        if len(self._cache) >= self._max_size:
+            self._evict_entries()
 
-            # Update tag index
-            for tag in tags:
-                if tag not in self._tag_index:
-                    self._tag_index[tag] = set()
-                self._tag_index[tag].add(key)
+        # Create entry
+        entry = CacheEntry(key, value, ttl, tags)
+        self._cache[key] = entry
+        heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._compact_expiry_heap()
+
+        # Update tag index
+        for tag in tags:
+            if tag not in self._tag_index:
+                self._tag_index[tag] = set()
+            self._tag_index[tag].add(key)
 
     async def invalidate(
         self,
@@ -144,8 +195,7 @@ class CacheManager:
         Args:
             key: Cache key
         """
-        async with self._lock:
-            await self._remove_entry(key)
+        self._remove_entry(key)
 
     async def invalidate_by_tag(
         self,
@@ -156,10 +206,9 @@ class CacheManager:
         Args:
             tag: Tag to invalidate
         """
-        async with self._lock:
-            keys = self._tag_index.get(tag, set()).copy()
-            for key in keys:
-                await self._remove_entry(key)
+        keys = self._tag_index.get(tag, set()).copy()
+        for key in keys:
+            self._remove_entry(key)
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -167,82 +216,86 @@ class CacheManager:
         Returns:
             Dictionary of cache statistics
         """
-        async with self._lock:
-            total_entries = len(self._cache)
-            expired_entries = sum(1 for e in self._cache.values() if e.is_expired())
-            total_tags = len(self._tag_index)
-
-            access_stats = {
-                "total_hits": sum(e.access_count for e in self._cache.values()),
-                "entries_by_access": {
-                    "high": sum(1 for e in self._cache.values() if e.access_count > 100),
-                    "medium": sum(1 for e in self._cache.values() if 10 < e.access_count <= 100),
-                    "low": sum(1 for e in self._cache.values() if e.access_count <= 10)
-                }
-            }
+        total_entries = len(self._cache)
+        total_tags = len(self._tag_index)
 
-            return {
-                "total_entries": total_entries,
-                "expired_entries": expired_entries,
-                "total_tags": total_tags,
-                "access_stats": access_stats,
-                "memory_usage": self._estimate_memory_usage()
+        # Single pass over the entries for every aggregate
+        expired_entries = total_hits = high = medium = low = memory = 0
+        now = time.monotonic()
+        for entry in self._cache.values():
+            if now > entry.expires_at:
+                expired_entries += 1
+            count = entry.access_count
+            total_hits += count
+            if count > 100:
+                high += 1
+            elif count > 10:
+                medium += 1
+            else:
+                low += 1
+            memory += entry.approx_size
+
+        access_stats = {
+            "total_hits": total_hits,
+            "entries_by_access": {
+                "high": high,
+                "medium": medium,
+                "low": low
             }
+        }
 
-    def _estimate_memory_usage(self) -> int:
-        """Estimate memory usage of cache.
-
-        Returns:
-            Estimated memory usage in bytes
-        """
-        total_size = 0
-        for entry in self._cache.values():
-            # Estimate size of key and value
-            total_size += len(entry.key.encode())
-            total_size += len(json.dumps(entry.value).encode())
-            # Add overhead for metadata
-            total_size += sum(len(tag.encode()) for tag in entry.tags)
-            total_size += 64  # Approximate size of timestamps and counters
-        return total_size
+        return {
+            "total_entries": total_entries,
+            "expired_entries": expired_entries,
+            "total_tags": total_tags,
+            "access_stats": access_stats,
+            "memory_usage": memory
+        }
 
     async def _cleanup_loop(self) -> None:
         """Background task for cleaning up expired entries."""
         while True:
             try:
                 await asyncio.sleep(self._cleanup_interval)
-                await self._cleanup_expired()
+                self._remove_expired()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in cleanup loop: {str(e)}")
-
-    async def _cleanup_expired(self) -> None:
-        """Clean up expired cache entries."""
-        async with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                await self._remove_entry(key)
-
-    async def _evict_entries(self) -> None:
+                logger.error("Error in cleanup loop: %s", e)
+
+    def _remove_expired(self) -> None:
+        """Remove all expired cache entries.
+
+        Only pops heap items that are due, so the cost scales with the
+        number of expired entries rather than the cache size.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale items for keys removed or re-set since
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(key)
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries only."""
+        self._expiry_heap = [
+            (entry.expires_at, key) for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _evict_entries(self) -> None:
         """Evict entries when cache is full."""
         # First remove expired entries
-        await self._cleanup_expired()
+        self._remove_expired()
 
-        # If still need to evict, use LRU strategy
+        # If still need to evict, drop the least recently used 10%
         if len(self._cache) >= self._max_size:
-            entries = sorted(
-                self._cache.items(),
-                key=lambda x: (x[1].last_accessed, -x[1].access_count)
-            )
-            # Remove 10% of entries
-            to_remove = entries[:max(1, len(entries) // 10)]
-            for key, _ in to_remove:
-                await self._remove_entry(key)
-
-    async def _remove_entry(self, key: str) -> None:
+            for _ in range(max(1, len(self._cache) // 10)):
+                self._remove_entry(next(iter(self._cache)))
+
+    def _remove_entry(self, key: str) -> None:
         """Remove a cache entry and update indexes.
 
         Args:
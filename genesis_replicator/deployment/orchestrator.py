@@ -3,8 +3,10 @@ Deployment orchestrator for managing model deployments across environments.
 """
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import sys
+import weakref
+from typing import Dict, Any, Optional, List, ValuesView
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from ..ai_module.model_registry import ModelRegistry, ModelState
@@ -13,7 +15,7 @@ from ..monitoring.health_checker import HealthChecker
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentConfig:
     """Configuration for model deployment."""
     model_name: str
@@ -23,7 +25,7 @@ class DeploymentConfig:
     scaling_config: Dict[str, Any]
     monitoring_config: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentStatus:
     """Status of a model deployment."""
     deployment_id: str
@@ -56,9 +58,27 @@ class DeploymentOrchestrator:
         self._metrics_collector = metrics_collector
         self._health_checker = health_checker
         self._deployments: Dict[str, DeploymentStatus] = {}
-        self._lock = asyncio.Lock()
+        # environment -> deployment_id -> status, for filtered listing
+        self._by_environment: Dict[str, Dict[str, DeploymentStatus]] = {}
+        # A deployment's lock is discarded once no operation holds or
+        # awaits it
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         logger.info("Deployment orchestrator initialized")
 
+    def _lock_for(self, deployment_id: str) -> asyncio.Lock:
+        """Get the lock serializing operations on a single deployment.
+
+        Deployments with different IDs never wait on each other. Runs
+        without awaiting, so the lookup-or-create is atomic on the event
+        loop.
+        """
+        lock = self._locks.get(deployment_id)
+        if lock is None:
+            lock = self._locks[deployment_id] = asyncio.Lock()
+        return lock
+
     async def deploy_model(
         self,
         config: DeploymentConfig
@@ -87,10 +107,16 @@ class DeploymentOrchestrator:
                 )
 
             # Create deployment ID
-            deployment_id = f"{config.model_name}-{config.version_id}-{config.environment}"
+            deployment_id = sys.intern(
+                f"{config.model_name}-{config.version_id}-{config.environment}"
+            )
 
-            async with self._lock:
+            # Only a deploy or undeploy of the same deployment waits here;
+            # the monitoring and registry calls below run concurrently
+            # with other deployments
+            async with self._lock_for(deployment_id):
                 # Create deployment status
+                now = datetime.now()
                 status = DeploymentStatus(
                     deployment_id=deployment_id,
                     model_name=config.model_name,
@@ -98,11 +124,14 @@ class DeploymentOrchestrator:
                     environment=config.environment,
                     status="deploying",
                     health_status="unknown",
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    created_at=now,
+                    updated_at=now,
                     metrics={}
                 )
                 self._deployments[deployment_id] = status
+                self._by_environment.setdefault(
+                    config.environment, {}
+                )[deployment_id] = status
 
                 try:
                     # Configure monitoring
@@ -127,46 +156,55 @@ class DeploymentOrchestrator:
                     # Update deployment status
                     status.status = "deployed"
                     status.updated_at = datetime.now()
-                    logger.info(f"Model deployed successfully: {deployment_id}")
+                    logger.info("Model deployed successfully: %s", deployment_id)
                     return deployment_id
 
                 except Exception as e:
                     status.status = "failed"
                     status.updated_at = datetime.now()
-                    logger.error(f"Deployment failed: {str(e)}")
+                    logger.error("Deployment failed: %s", e)
                     raise RuntimeError(f"Deployment failed: {str(e)}")
 
         except Exception as e:
-            logger.error(f"Failed to deploy model: {str(e)}")
+            logger.error("Failed to deploy model: %s", e)
             raise
 
     async def get_deployment_status(
         self,
         deployment_id: str
     ) -> Optional[DeploymentStatus]:
-        """Get status of a deployment.
+        """Get status of a deployment with fresh metrics and health.
+
+        The stored status is not modified; a copy carrying the latest
+        readings is returned, so pollers never contend with deployers.
 
         Args:
             deployment_id: Deployment identifier
 
         Returns:
             DeploymentStatus if found, None otherwise
+
+        Raises:
+            Exception: Propagated from the metrics collector or health
+                checker
         """
-        status = self._deployments.get(deployment_id)
-        if not status:
+        if deployment_id not in self._deployments:
             return None
 
-        # Update metrics
-        try:
-            metrics = await self._metrics_collector.get_metrics(deployment_id)
-            health = await self._health_checker.check_health(deployment_id)
-            status.metrics = metrics
-            status.health_status = health
-            status.updated_at = datetime.now()
-        except Exception as e:
-            logger.error(f"Failed to update deployment status: {str(e)}")
+        metrics = await self._metrics_collector.get_metrics(deployment_id)
+        health = await self._health_checker.check_health(deployment_id)
 
-        return status
+        # Snapshot after the awaits: the copy is taken without yielding, so
+        # it is consistent even if a deploy or undeploy ran meanwhile
+        status = self._deployments.get(deployment_id)
+        if status is None:
+            return None
+        return replace(
+            status,
+            metrics=metrics,
+            health_status=health,
+            updated_at=datetime.now()
+        )
 
     async def list_deployments(
         self,
@@ -180,10 +218,27 @@ class DeploymentOrchestrator:
         Returns:
             List of deployment statuses
         """
-        deployments = list(self._deployments.values())
+        return list(self.deployments_view(environment))
+
+    def deployments_view(
+        self,
+        environment: Optional[str] = None
+    ) -> ValuesView[DeploymentStatus]:
+        """Live view of deployments, optionally filtered by environment.
+
+        Unlike list_deployments this copies nothing, which suits pollers
+        that only iterate. Consume it before the next deploy or undeploy,
+        or wrap it in list() for a snapshot.
+
+        Args:
+            environment: Optional environment to filter by
+
+        Returns:
+            View of deployment statuses
+        """
         if environment:
-            deployments = [d for d in deployments if d.environment == environment]
-        return deployments
+            return self._by_environment.get(environment, {}).values()
+        return self._deployments.values()
 
     async def undeploy_model(
         self,
@@ -201,26 +256,36 @@ class DeploymentOrchestrator:
         if deployment_id not in self._deployments:
             raise ValueError(f"Deployment {deployment_id} not found")
 
-        try:
-            status = self._deployments[deployment_id]
-            status.status = "undeploying"
-            status.updated_at = datetime.now()
-
-            # Clean up monitoring
-            await self._metrics_collector.remove_monitoring(deployment_id)
-            await self._health_checker.remove_checks(deployment_id)
-
-            # Update model state
-            self._model_registry.update_model_state(
-                status.model_name,
-                status.version_id,
-                ModelState.ARCHIVED
-            )
-
-            # Remove deployment
-            del self._deployments[deployment_id]
-            logger.info(f"Model undeployed successfully: {deployment_id}")
+        async with self._lock_for(deployment_id):
+            # Re-check: a concurrent undeploy may have finished first
+            status = self._deployments.get(deployment_id)
+            if status is None:
+                raise ValueError(f"Deployment {deployment_id} not found")
+
+            try:
+                status.status = "undeploying"
+                status.updated_at = datetime.now()
+
+                # Clean up monitoring
+                await self._metrics_collector.remove_monitoring(deployment_id)
+                await self._health_checker.remove_checks(deployment_id)
+
+                # Update model state
+                self._model_registry.update_model_state(
+                    status.model_name,
+                    status.version_id,
+                    ModelState.ARCHIVED
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to undeploy model: {str(e)}")
-            raise RuntimeError(f"Undeployment failed: {str(e)}")
+                # Remove deployment
+                del self._deployments[deployment_id]
+                env_deployments = self._by_environment.get(status.environment)
+                if env_deployments is not None:
+                    env_deployments.pop(deployment_id, None)
+                    if not env_deployments:
+                        del self._by_environment[status.environment]
+                logger.info("Model undeployed successfully: %s", deployment_id)
+
+            except Exception as e:
+                logger.error("Failed to undeploy model: %s", e)
+                raise RuntimeError(f"Undeployment failed: {str(e)}")
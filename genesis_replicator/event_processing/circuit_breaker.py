@@ -2,12 +2,16 @@
 Circuit breaker implementation for fault tolerance.
 """
 import asyncio
+import heapq
 import logging
-from typing import Dict, Any, Optional, Callable, Awaitable
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 import json
+import sys
+import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -17,14 +21,14 @@ class CircuitState(Enum):
     OPEN = "open"         # Failing, reject requests
     HALF_OPEN = "half_open"  # Testing recovery
 
-@dataclass
+@dataclass(slots=True)
 class CircuitStats:
     """Circuit breaker statistics."""
     total_requests: int = 0
     failed_requests: int = 0
-    success_rate: float = 1.0
-    last_failure: Optional[datetime] = None
-    last_success: Optional[datetime] = None
+    # Monotonic seconds; converted to wall-clock time only for reporting
+    last_failure: Optional[float] = None
+    last_success: Optional[float] = None
     current_state: CircuitState = CircuitState.CLOSED
 
 class CircuitBreaker:
@@ -47,10 +51,34 @@ class CircuitBreaker:
         self._reset_timeout = reset_timeout
         self._half_open_timeout = half_open_timeout
         self._circuits: Dict[str, CircuitStats] = {}
-        self._lock = asyncio.Lock()
-        self._reset_timers: Dict[str, asyncio.Task] = {}
+        # Locks live only while some caller holds or awaits them, so the map
+        # does not grow with every circuit ever seen
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # Kept in step with state transitions so bulk reporting never has
+        # to walk every circuit's stats
+        self._open_circuits: Set[str] = set()
+        # One scheduler task serves every open circuit: a min-heap of
+        # (deadline, circuit_id), with the live deadline per circuit so
+        # cancelled or superseded entries are skipped
+        self._reset_heap: List[Tuple[float, str]] = []
+        self._reset_deadlines: Dict[str, float] = {}
+        self._reset_scheduler: Optional[asyncio.Task] = None
         logger.info("Circuit breaker initialized")
 
+    def _lock_for(self, circuit_id: str) -> asyncio.Lock:
+        """Get the lock guarding a single circuit's statistics.
+
+        Circuits are independent, so unrelated services never contend on a
+        shared lock. Runs without awaiting, so the lookup-or-create is
+        atomic on the event loop.
+        """
+        lock = self._locks.get(circuit_id)
+        if lock is None:
+            lock = self._locks[circuit_id] = asyncio.Lock()
+        return lock
+
     async def execute(
         self,
         circuit_id: str,
@@ -68,54 +96,58 @@ class CircuitBreaker:
         Raises:
             RuntimeError: If circuit is open
         """
-        async with self._lock:
-            if circuit_id not in self._circuits:
-                self._circuits[circuit_id] = CircuitStats()
-
-            stats = self._circuits[circuit_id]
-
-            # Check circuit state
-            if stats.current_state == CircuitState.OPEN:
-                if self._should_attempt_reset(stats):
-                    stats.current_state = CircuitState.HALF_OPEN
-                else:
-                    raise RuntimeError(f"Circuit {circuit_id} is open")
+        stats = self._circuits.get(circuit_id)
+        if stats is None:
+            # Interned once so repeat lookups can match on identity
+            circuit_id = sys.intern(circuit_id)
+            stats = self._circuits[circuit_id] = CircuitStats()
+
+        # Check circuit state; only a possible transition needs the lock
+        if stats.current_state is CircuitState.OPEN:
+            async with self._lock_for(circuit_id):
+                if stats.current_state is CircuitState.OPEN:
+                    if self._should_attempt_reset(stats):
+                        stats.current_state = CircuitState.HALF_OPEN
+                        self._open_circuits.discard(circuit_id)
+                    else:
+                        raise RuntimeError(f"Circuit {circuit_id} is open")
 
         try:
             # Execute operation
             result = await operation()
 
-            # Update success stats
-            async with self._lock:
-                stats = self._circuits[circuit_id]
-                stats.total_requests += 1
-                stats.last_success = datetime.now()
-                stats.success_rate = (stats.total_requests - stats.failed_requests) / stats.total_requests
+        except Exception:
+            # Update failure stats. Plain increments never await, so they
+            # are atomic on the event loop without taking the lock
+            stats = self._circuits[circuit_id]
+            stats.total_requests += 1
+            stats.failed_requests += 1
+            stats.last_failure = time.monotonic()
 
-                # Handle success in half-open state
-                if stats.current_state == CircuitState.HALF_OPEN:
-                    stats.current_state = CircuitState.CLOSED
-                    if circuit_id in self._reset_timers:
-                        self._reset_timers[circuit_id].cancel()
-
-            return result
-
-        except Exception as e:
-            # Update failure stats
-            async with self._lock:
-                stats = self._circuits[circuit_id]
-                stats.total_requests += 1
-                stats.failed_requests += 1
-                stats.last_failure = datetime.now()
-                stats.success_rate = (stats.total_requests - stats.failed_requests) / stats.total_requests
-
-                # Check if circuit should open
-                if self._should_open_circuit(stats):
+            # Check if circuit should open
+            if self._should_open_circuit(stats):
+                async with self._lock_for(circuit_id):
                     stats.current_state = CircuitState.OPEN
+                    self._open_circuits.add(circuit_id)
                     self._start_reset_timer(circuit_id)
 
             raise
 
+        # Update success stats
+        stats = self._circuits[circuit_id]
+        stats.total_requests += 1
+        stats.last_success = time.monotonic()
+
+        # Handle success in half-open state
+        if stats.current_state is CircuitState.HALF_OPEN:
+            async with self._lock_for(circuit_id):
+                # A failure may have reopened the circuit while waiting
+                if stats.current_state is CircuitState.HALF_OPEN:
+                    stats.current_state = CircuitState.CLOSED
+                    self._reset_deadlines.pop(circuit_id, None)
+
+        return result
+
     def _should_open_circuit(self, stats: CircuitStats) -> bool:
         """Check if circuit should open.
 
@@ -125,9 +157,10 @@ class CircuitBreaker:
         Returns:
             True if circuit should open
         """
+        # Failure rate above threshold, compared without dividing
         return (
             stats.total_requests >= 10 and  # Minimum sample size
-            stats.success_rate < (1 - self._failure_threshold)
+            stats.failed_requests > self._failure_threshold * stats.total_requests
         )
 
     def _should_attempt_reset(self, stats: CircuitStats) -> bool:
@@ -139,30 +172,48 @@ class CircuitBreaker:
         Returns:
             True if reset should be attempted
         """
-        if not stats.last_failure:
+        if stats.last_failure is None:
             return True
 
-        elapsed = (datetime.now() - stats.last_failure).total_seconds()
-        return elapsed >= self._reset_timeout
+        return time.monotonic() - stats.last_failure >= self._reset_timeout
 
     def _start_reset_timer(self, circuit_id: str) -> None:
-        """Start timer for circuit reset.
+        """Schedule a circuit to move to half-open after the reset timeout.
 
         Args:
             circuit_id: Circuit identifier
         """
-        if circuit_id in self._reset_timers:
-            self._reset_timers[circuit_id].cancel()
-
-        async def timer():
-            await asyncio.sleep(self._reset_timeout)
-            async with self._lock:
-                if circuit_id in self._circuits:
-                    stats = self._circuits[circuit_id]
-                    if stats.current_state == CircuitState.OPEN:
-                        stats.current_state = CircuitState.HALF_OPEN
+        deadline = time.monotonic() + self._reset_timeout
+        self._reset_deadlines[circuit_id] = deadline
+        heapq.heappush(self._reset_heap, (deadline, circuit_id))
 
-        self._reset_timers[circuit_id] = asyncio.create_task(timer())
+        if self._reset_scheduler is None or self._reset_scheduler.done():
+            self._reset_scheduler = asyncio.create_task(self._run_reset_scheduler())
+
+    async def _run_reset_scheduler(self) -> None:
+        """Move open circuits to half-open as their reset deadlines pass.
+
+        The reset timeout is fixed, so a newly scheduled deadline never
+        precedes the current head and the scheduler can simply sleep until
+        the earliest one. Exits once no resets are pending.
+        """
+        while self._reset_heap:
+            deadline, circuit_id = self._reset_heap[0]
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            heapq.heappop(self._reset_heap)
+            if self._reset_deadlines.get(circuit_id) != deadline:
+                continue  # Cancelled or rescheduled
+            del self._reset_deadlines[circuit_id]
+
+            async with self._lock_for(circuit_id):
+                stats = self._circuits.get(circuit_id)
+                if stats is not None and stats.current_state is CircuitState.OPEN:
+                    stats.current_state = CircuitState.HALF_OPEN
+                    self._open_circuits.discard(circuit_id)
 
     async def get_circuit_stats(
         self,
@@ -176,20 +227,44 @@ class CircuitBreaker:
         Returns:
             Circuit statistics if found
         """
-        async with self._lock:
-            if circuit_id not in self._circuits:
-                return None
+        if circuit_id not in self._circuits:
+            return None
 
+        async with self._lock_for(circuit_id):
             stats = self._circuits[circuit_id]
+            total = stats.total_requests
             return {
-                "total_requests": stats.total_requests,
+                "total_requests": total,
                 "failed_requests": stats.failed_requests,
-                "success_rate": stats.success_rate,
+                "success_rate": (total - stats.failed_requests) / total if total else 1.0,
                 "current_state": stats.current_state.value,
-                "last_failure": stats.last_failure.isoformat() if stats.last_failure else None,
-                "last_success": stats.last_success.isoformat() if stats.last_success else None
+                "last_failure": self._to_isoformat(stats.last_failure),
+                "last_success": self._to_isoformat(stats.last_success)
             }
 
+    async def get_open_circuits(self) -> List[str]:
+        """Get the circuits currently rejecting requests.
+
+        Returns:
+            Identifiers of open circuits
+        """
+        return list(self._open_circuits)
+
+    @staticmethod
+    def _to_isoformat(timestamp: Optional[float]) -> Optional[str]:
+        """Convert a monotonic timestamp to a wall-clock ISO string.
+
+        Args:
+            timestamp: Monotonic timestamp in seconds
+
+        Returns:
+            ISO formatted time, or None if no timestamp
+        """
+        if timestamp is None:
+            return None
+        wall_time = time.time() - (time.monotonic() - timestamp)
+        return datetime.fromtimestamp(wall_time).isoformat()
+
     async def reset_circuit(
         self,
         circuit_id: str
@@ -199,9 +274,10 @@ class CircuitBreaker:
         Args:
             circuit_id: Circuit identifier
         """
-        async with self._lock:
-            if circuit_id in self._circuits:
-                self._circuits[circuit_id] = CircuitStats()
-                if circuit_id in self._reset_timers:
-                    self._reset_timers[circuit_id].cancel()
-                    del self._reset_timers[circuit_id]
+        if circuit_id not in self._circuits:
+            return
+
+        async with self._lock_for(circuit_id):
+            self._circuits[circuit_id] = CircuitStats()
+            self._open_circuits.discard(circuit_id)
+            self._reset_deadlines.pop(circuit_id, None)
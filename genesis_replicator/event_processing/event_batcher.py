@@ -2,15 +2,20 @@
 Event batcher for optimizing event processing throughput.
 """
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Set, Callable, Awaitable
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set, Callable, Awaitable, Tuple, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class EventBatch:
     """Represents a batch of events."""
     batch_id: str
@@ -20,31 +25,65 @@ class EventBatch:
     priority: int
     tags: Set[str]
 
+class _PendingEvents:
+    """Events of one type awaiting batching.
+
+    Priorities and non-empty tag sets are also kept in columns of their
+    own, so computing a batch's aggregates never looks inside the event
+    dicts.
+    """
+    __slots__ = ("events", "priorities", "tags")
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.priorities = array("q")
+        self.tags: List[Set[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
 class EventBatcher:
-    """Manages event batching and processing optimization."""
+    """Manages event batching and processing optimization.
+
+    Batching state is only touched between awaits, so every operation is
+    atomic on the owning event loop and needs no lock. The batcher must only
+    be used from that loop's thread.
+    """
 
     def __init__(
         self,
         max_batch_size: int = 100,
         max_wait_time: float = 1.0,
-        min_batch_size: int = 10
+        min_batch_size: int = 10,
+        max_concurrent_batches: int = 4
     ):
         """Initialize event batcher.
 
         Args:
-            max_batch_size: Maximum events per batch
+            max_batch_size: Events per batch while processors are idle
             max_wait_time: Maximum wait time in seconds
-            min_batch_size: Minimum events for batch processing
+            min_batch_size: Unused, kept for compatibility; pending events
+                are always flushed once max_wait_time has passed
+            max_concurrent_batches: In-flight batches at which the target
+                batch size reaches twice max_batch_size
         """
         self._max_batch_size = max_batch_size
         self._max_wait_time = max_wait_time
-        self._min_batch_size = min_batch_size
-        self._batches: Dict[str, EventBatch] = {}
-        self._pending_events: Dict[str, List[Dict[str, Any]]] = {}
+        self._max_concurrent_batches = max_concurrent_batches
+        # Grows with processor load so busy processors get fewer, fuller
+        # batches instead of more small ones
+        self._target_batch_size = max_batch_size
+        self._pending_events: Dict[str, _PendingEvents] = {}
+        # Per event type batch sequence numbers, for unique batch IDs
+        self._batch_seq: Dict[str, Iterator[int]] = defaultdict(itertools.count)
         self._batch_processors: Dict[str, Callable[[EventBatch], Awaitable[None]]] = {}
-        self._lock = asyncio.Lock()
         self._processing_tasks: Set[asyncio.Task] = set()
-        self._batch_timers: Dict[str, asyncio.Task] = {}
+        # One timer handle serves every event type: a min-heap of
+        # (deadline, event_type), with the live deadline per type so entries
+        # for types flushed early are skipped
+        self._deadlines: List[Tuple[float, str]] = []
+        self._deadline_for: Dict[str, float] = {}
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
         logger.info("Event batcher initialized")
 
     async def add_event(
@@ -62,22 +101,42 @@ class EventBatcher:
             priority: Event priority
             tags: Optional event tags
         """
-        async with self._lock:
-            if event_type not in self._pending_events:
-                self._pending_events[event_type] = []
-                # Start batch timer
-                self._start_batch_timer(event_type)
-
-            self._pending_events[event_type].append({
-                "data": event_data,
-                "priority": priority,
-                "tags": tags or set(),
-                "timestamp": datetime.now().isoformat()
-            })
-
-            # Check if batch should be created
-            if len(self._pending_events[event_type]) >= self._max_batch_size:
-                await self._create_batch(event_type)
+        pending = self._pending_events.get(event_type)
+        if pending is None:
+            pending = self._pending_events[event_type] = _PendingEvents()
+        if event_type not in self._deadline_for:
+            # Start batch timer
+            self._start_batch_timer(event_type)
+
+        tags = tags or set()
+        pending.events.append({
+            "data": event_data,
+            "priority": priority,
+            "tags": tags,
+            # Unix seconds; formatting is left to processors that need it
+            "timestamp": time.time()
+        })
+        pending.priorities.append(priority)
+        if tags:
+            # Untagged events add nothing to the batch's tag union
+            pending.tags.append(tags)
+
+        # Check if batch should be created
+        self._target_batch_size = self._compute_target_batch_size()
+        if len(pending) >= self._target_batch_size:
+            self._create_batch(event_type)
+
+    def _compute_target_batch_size(self) -> int:
+        """Scale the batch size trigger by the number of in-flight batches.
+
+        Returns:
+            Between max_batch_size when idle and twice that at
+            max_concurrent_batches or more in flight
+        """
+        in_flight = min(len(self._processing_tasks), self._max_concurrent_batches)
+        return int(
+            self._max_batch_size * (1 + in_flight / self._max_concurrent_batches)
+        )
 
     async def register_processor(
         self,
@@ -99,52 +158,78 @@ class EventBatcher:
         Returns:
             Dictionary of batch statistics
         """
-        async with self._lock:
-            stats = {
-                "total_batches": len(self._batches),
-                "pending_events": {
-                    event_type: len(events)
-                    for event_type, events in self._pending_events.items()
-                },
-                "active_processors": len(self._processing_tasks),
-                "event_types": list(self._batch_processors.keys())
-            }
-            return stats
+        return {
+            "total_batches": len(self._processing_tasks),
+            "pending_events": {
+                event_type: len(pending)
+                for event_type, pending in self._pending_events.items()
+            },
+            "active_processors": len(self._processing_tasks),
+            "target_batch_size": self._target_batch_size,
+            "event_types": list(self._batch_processors.keys())
+        }
 
     def _start_batch_timer(self, event_type: str) -> None:
-        """Start timer for batch creation.
+        """Schedule batch creation after the maximum wait time.
 
         Args:
             event_type: Type of event
         """
-        if event_type in self._batch_timers:
-            self._batch_timers[event_type].cancel()
+        deadline = asyncio.get_running_loop().time() + self._max_wait_time
+        self._deadline_for[event_type] = deadline
+        heapq.heappush(self._deadlines, (deadline, event_type))
+
+        # The wait time is fixed, so a new deadline never precedes the one
+        # already armed
+        if self._timer_handle is None:
+            self._timer_handle = asyncio.get_running_loop().call_at(
+                deadline, self._on_batch_deadline
+            )
+
+    def _on_batch_deadline(self) -> None:
+        """Create batches for every event type whose deadline has passed.
+
+        Deadlines are armed by the first event after a flush, so no event is
+        held longer than max_wait_time, however few are pending.
+
+        Runs as a plain loop callback rather than a task, then re-arms
+        itself for the earliest remaining deadline.
+        """
+        self._timer_handle = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, event_type = heapq.heappop(self._deadlines)
+            if self._deadline_for.get(event_type) != deadline:
+                continue  # Flushed by size since
+            del self._deadline_for[event_type]
 
-        async def timer():
-            await asyncio.sleep(self._max_wait_time)
-            async with self._lock:
-                if event_type in self._pending_events:
-                    if len(self._pending_events[event_type]) >= self._min_batch_size:
-                        await self._create_batch(event_type)
+            if event_type in self._pending_events:
+                self._create_batch(event_type)
 
-        self._batch_timers[event_type] = asyncio.create_task(timer())
+        if self._deadlines:
+            self._timer_handle = loop.call_at(
+                self._deadlines[0][0], self._on_batch_deadline
+            )
 
-    async def _create_batch(self, event_type: str) -> None:
+    def _create_batch(self, event_type: str) -> None:
         """Create and process event batch.
 
         Args:
             event_type: Type of event
         """
-        if not self._pending_events[event_type]:
+        pending = self._pending_events[event_type]
+        if not pending:
             return
+        self._deadline_for.pop(event_type, None)
 
         # Create batch
-        events = self._pending_events[event_type]
-        batch_id = f"{event_type}-{datetime.now().isoformat()}"
+        events = pending.events
+        batch_id = f"{event_type}-{next(self._batch_seq[event_type])}"
 
-        # Calculate batch priority and tags
-        avg_priority = sum(e["priority"] for e in events) / len(events)
-        all_tags = set().union(*(e["tags"] for e in events))
+        # Calculate batch priority and tags from the parallel columns
+        avg_priority = sum(pending.priorities) / len(events)
+        all_tags = set().union(*pending.tags)
 
         batch = EventBatch(
             batch_id=batch_id,
@@ -155,14 +240,21 @@ class EventBatcher:
             tags=all_tags
         )
 
-        self._batches[batch_id] = batch
-        self._pending_events[event_type] = []
+        self._pending_events[event_type] = _PendingEvents()
 
         # Process batch
         if event_type in self._batch_processors:
-            task = asyncio.create_task(self._process_batch(batch, event_type))
-            self._processing_tasks.add(task)
-            task.add_done_callback(self._processing_tasks.discard)
+            # Started eagerly so the processor runs now rather than after a
+            # trip through the event loop; one that never suspends is done
+            # before the task is even returned
+            task = asyncio.Task(
+                self._process_batch(batch, event_type),
+                loop=asyncio.get_running_loop(),
+                eager_start=True
+            )
+            if not task.done():
+                self._processing_tasks.add(task)
+                task.add_done_callback(self._processing_tasks.discard)
 
     async def _process_batch(
         self,
@@ -181,19 +273,17 @@ class EventBatcher:
             logger.info(f"Processed batch: {batch.batch_id}")
         except Exception as e:
             logger.error(f"Failed to process batch {batch.batch_id}: {str(e)}")
-        finally:
-            async with self._lock:
-                if batch.batch_id in self._batches:
-                    del self._batches[batch.batch_id]
 
     async def stop(self) -> None:
         """Stop event batcher and clean up."""
-        # Cancel batch timers
-        for timer in self._batch_timers.values():
-            timer.cancel()
+        # Cancel batch timer
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
 
-        # Wait for processing tasks
+        # Wait for processing tasks; _process_batch handles its own errors,
+        # so nothing needs collecting
         if self._processing_tasks:
-            await asyncio.gather(*self._processing_tasks, return_exceptions=True)
+            await asyncio.wait(self._processing_tasks)
 
         logger.info("Event batcher stopped")
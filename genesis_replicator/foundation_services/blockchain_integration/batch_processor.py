@@ -4,15 +4,35 @@ Batch transaction processor for blockchain operations.
 This module handles batching and processing of blockchain transactions.
 """
 import asyncio
-from typing import List, Dict, Any, Optional
+import logging
+from collections import deque
+from functools import partial
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Tuple,
+    Union, cast
+)
+from eth_typing import ChecksumAddress
+from eth_utils import is_checksum_address, to_hex
 from web3 import AsyncWeb3
 from web3.exceptions import Web3Exception
+from web3.types import TxParams
 
 from ...foundation_services.exceptions import (
     BlockchainError,
     TransactionError
 )
 
+logger = logging.getLogger(__name__)
+
+# Transaction keys used for routing, never sent to the node
+_ROUTING_KEYS = frozenset({'web3', 'chain_idx'})
+
+# Pre-signed transactions carry their encoded bytes under this key and are
+# sent with eth_sendRawTransaction as-is
+_RAW_KEY = 'raw_transaction'
+
+# Any of these means the caller chose the fee model and values
+_FEE_KEYS = frozenset({'gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas'})
 
 class BatchProcessor:
     """Handles batching and processing of blockchain transactions."""
@@ -22,46 +42,117 @@ class BatchProcessor:
         self._batch_size = 10
         self._batch_interval = 1.0  # seconds
         self._max_retries = 3
+        self._max_queue_size = 100
         self._processing = False
-        self._batch_queue: List[Dict[str, Any]] = []
-        self._lock = asyncio.Lock()
+        # Set when the in-flight batch finishes, waking blocked producers
+        self._batch_done = asyncio.Event()
+        self._batch_queue: Deque[Dict[str, Any]] = deque()
+        # Failed transactions waiting out their backoff as (due, tx); the
+        # interval is fixed, so the deque is ordered by due time
+        self._retry_queue: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._retry_task: Optional[asyncio.Task] = None
+        # Retry counts by id() of queued transactions, so caller-supplied
+        # dicts are never mutated; entries only exist while a retry is queued
+        self._retries: Dict[int, int] = {}
+        # Registered connections, referenced by index from transactions
+        self._senders: List[AsyncWeb3] = []
+        self._sender_indices: Dict[int, int] = {}
+
+    def register_sender(self, web3: AsyncWeb3) -> int:
+        """Register a connection that transactions can be routed through.
+
+        Transactions carrying the returned index as 'chain_idx' need not
+        carry the connection itself. Registering a connection again
+        returns its existing index.
+
+        Args:
+            web3: Connection to send transactions through
+
+        Returns:
+            Sender index
+        """
+        index = self._sender_indices.get(id(web3))
+        if index is None:
+            index = self._sender_indices[id(web3)] = len(self._senders)
+            self._senders.append(web3)
+        return index
 
     async def add_transaction(self, transaction: Dict[str, Any]) -> None:
         """Add a transaction to the batch queue.
 
         Args:
-            transaction: Transaction parameters
+            transaction: Transaction parameters, with either a 'chain_idx'
+                from register_sender or the 'web3' connection to use
+
+        Waits while the queue is full, sending batches itself when none is
+        in flight, so producers cannot outrun the chain.
 
         Raises:
             TransactionError: If batch processing fails
         """
-        async with self._lock:
-            self._batch_queue.append(transaction)
-            if len(self._batch_queue) >= self._batch_size and not self._processing:
+        # Backpressure: never queue more than max_queue_size transactions
+        while len(self._batch_queue) >= self._max_queue_size:
+            if self._processing:
+                await self._batch_done.wait()
+            else:
                 await self._process_batch()
 
+        # Appending and checking never await, so they are atomic on the
+        # event loop; _process_batch sets _processing before its first await
+        self._batch_queue.append(transaction)
+        if len(self._batch_queue) >= self._batch_size and not self._processing:
+            await self._process_batch()
+
     async def _process_batch(self) -> None:
         """Process a batch of transactions."""
         try:
             self._processing = True
-            batch = self._batch_queue[:self._batch_size]
-            self._batch_queue = self._batch_queue[self._batch_size:]
-
-            # Process transactions in parallel
-            tasks = [
-                self._send_transaction(tx)
-                for tx in batch
+            self._batch_done.clear()
+            # Pop only the batch; slicing would copy the whole queue
+            queue = self._batch_queue
+            batch = [
+                queue.popleft()
+                for _ in range(min(self._batch_size, len(queue)))
             ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Handle results
-            for tx, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    print(f"Transaction failed: {str(result)}")
-                    # Add to retry queue if retries remaining
-                    if tx.get('retries', 0) < self._max_retries:
-                        tx['retries'] = tx.get('retries', 0) + 1
-                        self._batch_queue.append(tx)
+            # One JSON-RPC batch request per connection, all sent in parallel
+            groups: Dict[int, List[int]] = {}
+            for index, tx in enumerate(batch):
+                sender = tx.get('chain_idx')
+                if sender is None:
+                    sender = self.register_sender(tx['web3'])
+                groups.setdefault(sender, []).append(index)
+
+            senders = self._senders
+            results: List[Optional[Union[str, BaseException]]] = [None] * len(batch)
+            group_results = await asyncio.gather(*(
+                self._send_transactions(senders[sender], [batch[i] for i in indices])
+                for sender, indices in groups.items()
+            ))
+            for indices, sent in zip(groups.values(), group_results):
+                for index, outcome in zip(indices, sent):
+                    results[index] = outcome
+
+            # Handle results; successes need no work unless retries are pending
+            retries = self._retries
+            for index, result in enumerate(results):
+                if not isinstance(result, BaseException):
+                    if retries:
+                        retries.pop(id(batch[index]), None)
+                    continue
+
+                tx = batch[index]
+                attempts = retries.pop(id(tx), 0)
+                logger.debug("Transaction failed: %s", result)
+                # Add to retry queue if retries remaining
+                if attempts < self._max_retries:
+                    retries[id(tx)] = attempts + 1
+                    self._schedule_retry(tx)
+                else:
+                    logger.warning(
+                        "Transaction dropped after %d retries: %s",
+                        attempts, result
+                    )
 
         except Exception as e:
             raise TransactionError(
@@ -70,11 +161,254 @@ class BatchProcessor:
             )
         finally:
             self._processing = False
+            self._batch_done.set()
+
+    def _schedule_retry(self, transaction: Dict[str, Any]) -> None:
+        """Requeue a failed transaction once the batch interval has passed.
+
+        Args:
+            transaction: Transaction parameters
+        """
+        due = asyncio.get_running_loop().time() + self._batch_interval
+        self._retry_queue.append((due, transaction))
+
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self._run_retry_loop())
+
+    async def _run_retry_loop(self) -> None:
+        """Move retries into the batch queue as they become due.
+
+        A single task serves every pending retry, so backoff never holds up
+        the batch that failed. Exits once no retries are pending.
+        """
+        loop = asyncio.get_running_loop()
+        retry_queue = self._retry_queue
+        while retry_queue:
+            delay = retry_queue[0][0] - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            self._batch_queue.append(retry_queue.popleft()[1])
+
+    async def _send_transactions(
+        self,
+        web3: AsyncWeb3,
+        transactions: List[Dict[str, Any]]
+    ) -> List[Union[str, BaseException]]:
+        """Send transactions for one connection in a single JSON-RPC batch.
+
+        Falls back to one request per transaction when the provider cannot
+        batch.
+
+        Args:
+            web3: Connection the transactions are sent through
+            transactions: Transaction parameters
+
+        Returns:
+            Transaction hash or exception, in the order of transactions
+        """
+        make_batch_request = getattr(web3.provider, 'make_batch_request', None)
+        if make_batch_request is None or len(transactions) == 1:
+            return await asyncio.gather(
+                *(self._send_transaction(web3, tx) for tx in transactions),
+                return_exceptions=True
+            )
+
+        # Raw requests bypass web3's send_transaction, so fill its defaults
+        # here; transactions that cannot be filled fail on their own
+        unsigned = [tx for tx in transactions if _RAW_KEY not in tx]
+        filled = iter(await self._fill_defaults(web3, unsigned))
+
+        results: List[Union[str, BaseException]] = []
+        ready: List[int] = []
+        requests: List[Tuple[str, List[Any]]] = []
+        for index, tx in enumerate(transactions):
+            request: Tuple[str, List[Any]]
+            if _RAW_KEY in tx:
+                request = ('eth_sendRawTransaction', [to_hex(tx[_RAW_KEY])])
+            else:
+                params = next(filled)
+                if isinstance(params, BaseException):
+                    results.append(params)
+                    continue
+                request = ('eth_sendTransaction', [self._to_rpc_params(params)])
+            results.append('')
+            ready.append(index)
+            requests.append(request)
+        if not ready:
+            return results
 
-    async def _send_transaction(self, transaction: Dict[str, Any]) -> str:
+        try:
+            responses = await make_batch_request(requests)
+        except Exception as e:
+            error = TransactionError(
+                f"Batch request failed: {str(e)}",
+                details={"error": str(e)}
+            )
+            for index in ready:
+                results[index] = error
+            return results
+
+        # A rejected batch comes back as a single error object
+        if not isinstance(responses, list) or len(responses) != len(ready):
+            error_info = responses.get('error') if isinstance(responses, dict) else None
+            error = TransactionError(
+                f"Batch request failed: {error_info}",
+                details={"error": error_info}
+            )
+            for index in ready:
+                results[index] = error
+            return results
+
+        # Responses are ordered by request id, which follows request order
+        for index, response in zip(ready, responses):
+            if 'error' in response:
+                results[index] = TransactionError(
+                    f"Transaction failed: {response['error']}",
+                    details={
+                        "transaction": transactions[index],
+                        "error": response['error']
+                    }
+                )
+            else:
+                results[index] = response['result']
+        return results
+
+    async def _fill_defaults(
+        self,
+        web3: AsyncWeb3,
+        transactions: List[Dict[str, Any]]
+    ) -> List[Union[TxParams, BaseException]]:
+        """Build the parameters to send for unsigned transactions.
+
+        Fills the sender, chain id, EIP-1559 fees and gas that web3's
+        send_transaction would otherwise add, with every lookup for the
+        transactions in one JSON-RPC batch. Both send paths use this, so a
+        transaction is submitted identically whether or not it is batched.
+
+        Args:
+            web3: Connection the transactions are sent through
+            transactions: Transaction parameters
+
+        Returns:
+            Parameters with routing keys removed and defaults filled in, or
+            the exception that prevented it, in the order of transactions
+        """
+        default_account = web3.eth.default_account
+        has_default_account = is_checksum_address(default_account)
+        params_list = []
+        for transaction in transactions:
+            params = cast(TxParams, {
+                key: value for key, value in transaction.items()
+                if key not in _ROUTING_KEYS
+            })
+            if 'from' not in params and has_default_account:
+                params['from'] = cast(ChecksumAddress, default_account)
+            params_list.append(params)
+
+        need_chain_id = any('chainId' not in params for params in params_list)
+        need_fees = any(not _FEE_KEYS.intersection(params) for params in params_list)
+        need_gas = [
+            index for index, params in enumerate(params_list)
+            if 'gas' not in params
+        ]
+
+        lookups: List[Callable[[], Awaitable[Any]]] = []
+        if need_chain_id:
+            lookups.append(lambda: web3.eth.chain_id)
+        if need_fees:
+            lookups.append(lambda: web3.eth.max_priority_fee)
+            lookups.append(lambda: web3.eth.get_block('latest'))
+        lookups.extend(
+            partial(web3.eth.estimate_gas, params_list[index])
+            for index in need_gas
+        )
+        values = iter(await self._run_lookups(web3, lookups))
+
+        chain_id: Any = next(values) if need_chain_id else None
+        priority_fee: Any = next(values) if need_fees else None
+        block: Any = next(values) if need_fees else None
+        # Lookups shared by every transaction fail them all
+        for value in (chain_id, priority_fee, block):
+            if isinstance(value, BaseException):
+                return [value] * len(params_list)
+
+        results: List[Union[TxParams, BaseException]] = []
+        gas_estimates = dict(zip(need_gas, values))
+        for index, params in enumerate(params_list):
+            gas = gas_estimates.get(index)
+            if isinstance(gas, BaseException):
+                results.append(gas)
+                continue
+            if 'chainId' not in params:
+                params['chainId'] = chain_id
+            if not _FEE_KEYS.intersection(params):
+                # Same fee cap web3 applies when it fills fees itself
+                params['maxPriorityFeePerGas'] = priority_fee
+                params['maxFeePerGas'] = priority_fee + 2 * block['baseFeePerGas']
+            if gas is not None:
+                params['gas'] = gas
+            results.append(params)
+        return results
+
+    @staticmethod
+    async def _run_lookups(
+        web3: AsyncWeb3,
+        lookups: List[Callable[[], Awaitable[Any]]]
+    ) -> List[Any]:
+        """Run RPC lookups in one JSON-RPC batch.
+
+        Falls back to overlapping single requests when the batch cannot be
+        sent or any entry fails, so one failing lookup does not take the
+        others with it.
+
+        Args:
+            web3: Connection to query
+            lookups: Functions starting each lookup
+
+        Returns:
+            Lookup results or exceptions, in the order of lookups
+        """
+        if not lookups:
+            return []
+        try:
+            async with web3.batch_requests() as batch:
+                for lookup in lookups:
+                    batch.add(lookup())
+                return list(await batch.async_execute())
+        except Exception as e:
+            logger.debug("Batched lookups failed, sending individually: %s", e)
+            return await asyncio.gather(
+                *(lookup() for lookup in lookups),
+                return_exceptions=True
+            )
+
+    @staticmethod
+    def _to_rpc_params(transaction: Mapping[str, Any]) -> Dict[str, Any]:
+        """Encode transaction parameters for a raw JSON-RPC request.
+
+        Args:
+            transaction: Transaction parameters
+
+        Returns:
+            Parameters with quantities and bytes hex encoded and routing
+            keys removed
+        """
+        return {
+            key: to_hex(value) if isinstance(value, (int, bytes)) else value
+            for key, value in transaction.items()
+            if key not in _ROUTING_KEYS
+        }
+
+    async def _send_transaction(
+        self,
+        web3: AsyncWeb3,
+        transaction: Dict[str, Any]
+    ) -> str:
         """Send a single transaction.
 
         Args:
+            web3: Connection to send the transaction through
             transaction: Transaction parameters
 
         Returns:
@@ -84,8 +418,13 @@ class BatchProcessor:
             TransactionError: If transaction fails
         """
         try:
-            web3: AsyncWeb3 = transaction['web3']
-            tx_hash = await web3.eth.send_transaction(transaction)
+            if _RAW_KEY in transaction:
+                tx_hash = await web3.eth.send_raw_transaction(transaction[_RAW_KEY])
+            else:
+                params = (await self._fill_defaults(web3, [transaction]))[0]
+                if isinstance(params, BaseException):
+                    raise params
+                tx_hash = await web3.eth.send_transaction(params)
             return tx_hash.hex()
         except Web3Exception as e:
             raise TransactionError(
@@ -107,7 +446,8 @@ class BatchProcessor:
         self,
         batch_size: Optional[int] = None,
         batch_interval: Optional[float] = None,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        max_queue_size: Optional[int] = None
     ) -> None:
         """Configure batch processor parameters.
 
@@ -115,6 +455,8 @@ class BatchProcessor:
             batch_size: Number of transactions per batch
             batch_interval: Interval between batch processing
             max_retries: Maximum number of retry attempts
+            max_queue_size: Queued transactions at which add_transaction
+                waits; retries may briefly exceed it
         """
         if batch_size is not None:
             self._batch_size = batch_size
@@ -122,3 +464,5 @@ class BatchProcessor:
             self._batch_interval = batch_interval
         if max_retries is not None:
             self._max_retries = max_retries
+        if max_queue_size is not None:
+            self._max_queue_size = max_queue_size
@@ -4,7 +4,9 @@ Chain Manager for blockchain integration.
 This module manages multi-chain operations, network connections, and chain status monitoring.
 """
 import asyncio
-from typing import Dict, List, Optional, Any, Type
+import logging
+from typing import Dict, List, Optional, Any, Set, Type
+import aiohttp
 from web3 import AsyncWeb3
 from web3.exceptions import Web3Exception
 
@@ -16,12 +18,26 @@ from ...foundation_services.exceptions import (
 from .protocols.base import BaseProtocolAdapter
 from .protocols.bnb_chain import BNBChainAdapter
 
+logger = logging.getLogger(__name__)
 
 class ChainManager:
     """Manages blockchain network connections and operations."""
 
-    def __init__(self):
-        """Initialize the chain manager."""
+    def __init__(
+        self,
+        head_poll_interval: float = 3.0,
+        pool_size: int = 256,
+        pool_keepalive: int = 60
+    ):
+        """Initialize the chain manager.
+
+        Args:
+            head_poll_interval: Seconds between new-block checks while a
+                chain has head subscribers
+            pool_size: Maximum number of pooled RPC connections, shared by
+                every chain
+            pool_keepalive: Seconds an idle pooled connection is kept open
+        """
         self._connections: Dict[str, AsyncWeb3] = {}
         self._chain_configs: Dict[str, Dict[str, Any]] = {}
         self._status_monitors: Dict[str, asyncio.Task] = {}
@@ -29,8 +45,32 @@ class ChainManager:
         self._connection_semaphore = asyncio.Semaphore(10)  # Limit concurrent connections
         self._connection_pool: Dict[str, List[AsyncWeb3]] = {}
         self._protocol_adapters: Dict[str, BaseProtocolAdapter] = {}
+        self._head_poll_interval = head_poll_interval
+        self._head_watchers: Dict[str, asyncio.Task] = {}
+        self._head_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._pool_size = pool_size
+        self._pool_keepalive = pool_keepalive
+        # Created lazily so it binds to the running event loop
+        self._http: Optional[aiohttp.ClientSession] = None
         self._initialized = False
 
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session shared by all RPC providers.
+
+        web3's own per-provider sessions close each connection after use;
+        sharing one keep-alive pool reuses TCP and TLS connections across
+        requests and chains.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size,
+                    keepalive_timeout=self._pool_keepalive
+                ),
+                raise_for_status=True
+            )
+        return self._http
+
     async def start(self) -> None:
         """Initialize and start the chain manager.
 
@@ -43,19 +83,30 @@ class ChainManager:
             self._initialized = True
             self._connections.clear()
             self._chain_configs.clear()
+            self._connection_pool.clear()
             self._status_monitors.clear()
             self._protocol_adapters.clear()
 
-            # Register default protocol adapters
-            await self.register_protocol_adapter("bnb", BNBChainAdapter())
+            # Register default protocol adapters; set directly because
+            # register_protocol_adapter takes the lock held here
+            self._protocol_adapters["bnb"] = BNBChainAdapter()
 
     async def stop(self) -> None:
         """Stop and cleanup the chain manager."""
+        # Disconnect from all chains; disconnect_from_chain takes the lock
+        # itself, so it must not be held here
+        for chain_id in list(self._connections.keys()):
+            await self.disconnect_from_chain(chain_id)
+
         async with self._lock:
-            # Disconnect from all chains
-            for chain_id in list(self._connections.keys()):
-                await self.disconnect_from_chain(chain_id)
             self._initialized = False
+
+            # Providers cache the session they were given, so drop them all
+            # with it; a restart creates fresh providers on a new session
+            self._connection_pool.clear()
+            if self._http is not None and not self._http.closed:
+                await self._http.close()
+            self._http = None
             self._protocol_adapters.clear()
 
     async def register_protocol_adapter(self, chain_type: str, adapter: BaseProtocolAdapter) -> None:
@@ -199,11 +250,12 @@ class ChainManager:
                                 f"Unsupported protocol {protocol}",
                                 details={"chain_id": chain_id, "protocol": protocol}
                             )
-                        await adapter.configure_web3(endpoint_url)
+                        await adapter.configure_web3(endpoint_url, self._get_http())
                         web3 = adapter.web3
                     else:
                         # Fallback to direct Web3 connection
                         web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(endpoint_url))
+                        await web3.provider.cache_async_session(self._get_http())
 
                     # Initialize connection pool
                     if chain_id not in self._connection_pool:
@@ -270,6 +322,12 @@ class ChainManager:
                     self._status_monitors[chain_id].cancel()
                     del self._status_monitors[chain_id]
 
+                # Stop new-block notifications
+                watcher = self._head_watchers.pop(chain_id, None)
+                if watcher:
+                    watcher.cancel()
+                self._head_subscribers.pop(chain_id, None)
+
                 # Close connection and cleanup
                 del self._connections[chain_id]
                 del self._chain_configs[chain_id]
@@ -303,10 +361,24 @@ class ChainManager:
 
             web3 = self._connections[chain_id]
 
-            # Gather chain information
-            block_number = await web3.eth.block_number
-            gas_price = await web3.eth.gas_price
-            syncing = await web3.eth.syncing
+            # Gather chain information in one JSON-RPC batch round trip, or
+            # as overlapping requests if the provider or endpoint cannot batch
+            try:
+                async with web3.batch_requests() as batch:
+                    batch.add(web3.eth.get_block_number())
+                    batch.add(web3.eth.gas_price)
+                    batch.add(web3.eth.syncing)
+                    block_number, gas_price, syncing = await batch.async_execute()
+            except Exception as e:
+                logger.debug(
+                    "Batch request failed on chain %s, sending individually: %s",
+                    chain_id, e
+                )
+                block_number, gas_price, syncing = await asyncio.gather(
+                    web3.eth.block_number,
+                    web3.eth.gas_price,
+                    web3.eth.syncing
+                )
 
             return {
                 "chain_id": chain_id,
@@ -386,6 +458,91 @@ class ChainManager:
                 }
             )
 
+    async def subscribe_new_head(self, chain_id: str) -> asyncio.Queue:
+        """Subscribe to new-block notifications for a chain.
+
+        All subscribers of a chain share one block watcher, so the RPC cost
+        does not grow with the number of waiters. The returned queue holds
+        only the latest block number; a slow consumer skips intermediate
+        blocks rather than accumulating a backlog.
+
+        Args:
+            chain_id: Chain identifier to watch
+
+        Returns:
+            Queue receiving the block number of each new head
+
+        Raises:
+            ChainConnectionError: If chain not connected
+        """
+        if chain_id not in self._connections:
+            raise ChainConnectionError(
+                f"Chain {chain_id} not connected",
+                details={"chain_id": chain_id}
+            )
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._head_subscribers.setdefault(chain_id, set()).add(queue)
+
+        watcher = self._head_watchers.get(chain_id)
+        if watcher is None or watcher.done():
+            self._head_watchers[chain_id] = asyncio.create_task(
+                self._watch_new_heads(chain_id)
+            )
+        return queue
+
+    async def unsubscribe_new_head(self, chain_id: str, queue: asyncio.Queue) -> None:
+        """Cancel a new-block subscription.
+
+        The chain's block watcher stops once its last subscriber leaves.
+
+        Args:
+            chain_id: Chain identifier
+            queue: Queue returned by subscribe_new_head
+        """
+        subscribers = self._head_subscribers.get(chain_id)
+        if subscribers is None:
+            return
+
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._head_subscribers[chain_id]
+            watcher = self._head_watchers.pop(chain_id, None)
+            if watcher:
+                watcher.cancel()
+
+    async def _watch_new_heads(self, chain_id: str) -> None:
+        """Publish new block numbers to a chain's head subscribers.
+
+        Args:
+            chain_id: Chain identifier to watch
+        """
+        last_block = None
+        delay = self._head_poll_interval
+        while self._head_subscribers.get(chain_id):
+            web3 = self._connections.get(chain_id)
+            if web3 is None:
+                break
+
+            try:
+                block_number = await web3.eth.block_number
+            except Exception as e:
+                # Transport errors from the shared session surface as
+                # aiohttp/timeout errors; back off and keep watching
+                logger.error("Error watching blocks on chain %s: %s", chain_id, e)
+                delay = min(delay * 2, max(self._head_poll_interval, 30.0))
+            else:
+                delay = self._head_poll_interval
+                if block_number != last_block:
+                    last_block = block_number
+                    for queue in list(self._head_subscribers.get(chain_id, ())):
+                        # Keep only the latest head for slow consumers
+                        if queue.full():
+                            queue.get_nowait()
+                        queue.put_nowait(block_number)
+
+            await asyncio.sleep(delay)
+
     async def _monitor_chain_status(self, chain_id: str) -> None:
         """Monitor chain status and manage connection pool.
 
@@ -396,15 +553,21 @@ class ChainManager:
             try:
                 await asyncio.sleep(30)  # Check every 30 seconds
 
-                async with self._lock:
-                    if chain_id not in self._connections:
-                        break
+                web3 = self._connections.get(chain_id)
+                if web3 is None:
+                    break
 
-                    web3 = self._connections[chain_id]
-                    try:
-                        # Test connection
-                        await asyncio.wait_for(web3.eth.chain_id, timeout=5.0)
-                    except (Web3Exception, asyncio.TimeoutError):
+                # Probe without holding the lock so every chain's monitor
+                # checks its connection concurrently
+                try:
+                    await asyncio.wait_for(web3.eth.chain_id, timeout=5.0)
+                    continue
+                except (Web3Exception, asyncio.TimeoutError):
+                    pass
+
+                async with self._lock:
+                    # Skip if the chain was disconnected or failed over meanwhile
+                    if self._connections.get(chain_id) is web3:
                         # Remove failed connection from pool
                         if chain_id in self._connection_pool:
                             pool = self._connection_pool[chain_id]
@@ -4,23 +4,60 @@ Base protocol adapter for blockchain integration.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
-from web3 import Web3
+import aiohttp
+from web3 import AsyncWeb3
 from web3.types import TxParams, Wei
 
 class BaseProtocolAdapter(ABC):
     """Base class for blockchain protocol adapters."""
 
     def __init__(self):
-        self.web3: Optional[Web3] = None
+        self.web3: Optional[AsyncWeb3] = None
         self.chain_id: Optional[int] = None
         self.native_currency: str = ""
         self.block_time: int = 0  # Average block time in seconds
 
     @abstractmethod
-    async def configure_web3(self, provider_url: str) -> None:
-        """Configure Web3 instance for the protocol."""
+    async def configure_web3(
+        self,
+        provider_url: str,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> None:
+        """Configure Web3 instance for the protocol.
+
+        Args:
+            provider_url: RPC endpoint URL
+            session: Optional shared HTTP session for the provider
+        """
         pass
 
+    @staticmethod
+    async def _create_web3(
+        provider_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        **request_kwargs: Any
+    ) -> AsyncWeb3:
+        """Create an async Web3 instance over HTTP.
+
+        The session must be attached before the first request; web3 keeps
+        the first session it caches for an endpoint.
+
+        Args:
+            provider_url: RPC endpoint URL
+            session: Optional shared HTTP session for the provider
+            **request_kwargs: Options passed with every HTTP request
+
+        Returns:
+            Web3 instance
+        """
+        web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(
+            provider_url,
+            request_kwargs=request_kwargs
+        ))
+        if session is not None:
+            await web3.provider.cache_async_session(session)
+        return web3
+
     @abstractmethod
     async def estimate_gas(self, tx_params: TxParams) -> Wei:
         """Estimate gas for a transaction."""
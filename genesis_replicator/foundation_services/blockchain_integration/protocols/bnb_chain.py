@@ -3,7 +3,7 @@ BNB Chain protocol adapter implementation.
 """
 from typing import Any, Dict, Optional, Union
 
-from web3 import Web3
+import aiohttp
 from web3.exceptions import InvalidAddress
 from web3.types import TxParams, Wei
 
@@ -19,10 +19,15 @@ class BNBChainAdapter(BaseProtocolAdapter):
         self.block_time = 3  # 3 seconds average block time
         self.max_gas_limit = 30_000_000  # Maximum gas limit for BNB Chain
 
-    async def configure_web3(self, provider_url: str) -> None:
+    async def configure_web3(
+        self,
+        provider_url: str,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> None:
         """Configure Web3 instance for BNB Chain."""
-        self.web3 = Web3(Web3.HTTPProvider(provider_url))
-        if not self.web3.is_connected():
+        # Async provider so connection checks never block the event loop
+        self.web3 = await self._create_web3(provider_url, session, timeout=5)
+        if not await self.web3.is_connected():
             raise ConnectionError("Failed to connect to BNB Chain node")
 
         # Verify chain ID
@@ -7,7 +7,8 @@ Handles vertical scaling and resource optimization.
 import asyncio
 import logging
 import psutil
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -27,7 +28,8 @@ class ResourceOptimizer:
 
     def __init__(self):
         """Initialize the resource optimizer."""
-        self._metrics_history: List[ResourceMetrics] = []
+        # Keep last 100 measurements; older ones drop off in O(1)
+        self._metrics_history: Deque[ResourceMetrics] = deque(maxlen=100)
         self._optimization_task: Optional[asyncio.Task] = None
         self._thresholds = {
             'cpu_high': 80.0,
@@ -67,8 +69,6 @@ class ResourceOptimizer:
         )
 
         self._metrics_history.append(metrics)
-        if len(self._metrics_history) > 100:  # Keep last 100 measurements
-            self._metrics_history.pop(0)
 
         return metrics
 
@@ -53,3 +53,81 @@ async def test_partial_backup_restoration(backup_manager, sample_state):
     # Restore only state component
     success = await backup_manager.restore_backup(backup_id, components=["state"])
     assert success is True
+
+async def test_list_backups_rebuilds_missing_index(backup_manager):
+    """Test listing backups falls back to scanning when the index is gone."""
+    backup_ids = [
+        await backup_manager.create_backup(["state"]) for _ in range(2)
+    ]
+    index_path = Path(backup_manager.backup_dir) / "_index.ndjson"
+    assert index_path.exists()
+
+    index_path.unlink()
+    backups = await backup_manager.list_backups()
+    assert [b["backup_id"] for b in backups] == sorted(backup_ids, reverse=True)
+    assert index_path.exists()
+
+async def test_component_locks_released(backup_manager):
+    """Test per-component locks are not retained after a backup."""
+    await backup_manager.create_backup(["state", "config"])
+    assert len(backup_manager._component_locks) == 0
+
+async def test_list_backups_orders_legacy_ids_by_timestamp(backup_manager):
+    """Test legacy timestamp-named backups sort by time among new ones."""
+    legacy_path = Path(backup_manager.backup_dir) / "20240101_000000"
+    legacy_path.mkdir()
+    with open(legacy_path / "metadata.json", "w") as f:
+        json.dump({
+            "backup_id": "20240101_000000",
+            "timestamp": "2024-01-01T00:00:00",
+            "components": ["state"],
+            "status": "completed"
+        }, f)
+
+    backup_id = await backup_manager.create_backup(["state"])
+
+    backups = await backup_manager.list_backups()
+    assert [b["backup_id"] for b in backups] == [backup_id, "20240101_000000"]
+
+async def test_list_backups_includes_pre_index_backups(backup_manager):
+    """Test backups written before the index existed are listed."""
+    for backup_id, timestamp in [
+        ("20240101_000000", "2024-01-01T00:00:00"),
+        ("20240102_000000", "2024-01-02T00:00:00"),
+    ]:
+        backup_path = Path(backup_manager.backup_dir) / backup_id
+        backup_path.mkdir()
+        with open(backup_path / "metadata.json", "w") as f:
+            json.dump({
+                "backup_id": backup_id,
+                "timestamp": timestamp,
+                "components": ["state"],
+                "status": "completed"
+            }, f)
+
+    backups = await backup_manager.list_backups()
+    assert [b["backup_id"] for b in backups] == ["20240102_000000", "20240101_000000"]
+    assert (Path(backup_manager.backup_dir) / "_index.ndjson").exists()
+
+async def test_legacy_backup_restoration(backup_manager):
+    """Test restoring a backup with per-component directories."""
+    backup_path = Path(backup_manager.backup_dir) / "20240101_000000"
+    (backup_path / "state").mkdir(parents=True)
+    (backup_path / "state" / "state.json").write_bytes(b"{}")
+    (backup_path / "config").mkdir()
+    with open(backup_path / "metadata.json", "w") as f:
+        json.dump({
+            "backup_id": "20240101_000000",
+            "timestamp": "2024-01-01T00:00:00",
+            "components": ["state", "config"],
+            "status": "completed"
+        }, f)
+
+    restored = {}
+
+    async def restore_state(files):
+        restored.update(files)
+
+    backup_manager._restore_state = restore_state
+    assert await backup_manager.restore_backup("20240101_000000") is True
+    assert restored == {"state.json": b"{}"}
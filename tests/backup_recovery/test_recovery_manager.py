@@ -86,3 +86,28 @@ async def test_circular_dependencies(recovery_manager):
 
     with pytest.raises(ValueError, match="Circular dependency detected"):
         await recovery_manager.execute_all()
+
+async def test_independent_procedures_run_concurrently(recovery_manager):
+    """Test procedures without mutual dependencies execute in parallel."""
+    running = 0
+    max_running = 0
+
+    async def proc():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.1)
+        running -= 1
+
+    recovery_manager.register_procedure(name="proc_a", handler=proc)
+    recovery_manager.register_procedure(name="proc_b", handler=proc)
+    recovery_manager.register_procedure(
+        name="proc_c",
+        handler=proc,
+        dependencies=["proc_a", "proc_b"]
+    )
+
+    success = await recovery_manager.execute_all()
+    assert success is True
+    assert max_running == 2
+    assert recovery_manager.get_procedure_status("proc_c") == RecoveryStatus.COMPLETED
@@ -79,3 +79,49 @@ async def test_concurrent_state_access(state_manager, sample_state):
     # Verify final state
     final_state = await state_manager.load_state(component)
     assert final_state is not None
+
+async def test_unchanged_state_skips_write(state_manager, sample_state):
+    """Test saving identical state does not rewrite the file."""
+    component = "test_component"
+
+    await state_manager.save_state(component, sample_state)
+    state_file = Path(state_manager.state_dir) / f"{component}.json"
+    state_file.unlink()
+
+    # Same content is deduplicated against the cached hash
+    assert await state_manager.save_state(component, dict(sample_state)) is True
+    assert not state_file.exists()
+
+    # Changed content is written
+    await state_manager.save_state(component, {**sample_state, "extra": 1})
+    assert state_file.exists()
+
+async def test_state_cache_bounded(state_dir, sample_state):
+    """Test the state cache evicts least recently used components."""
+    from genesis_replicator.backup_recovery.state_persistence import StatePersistenceManager
+
+    manager = StatePersistenceManager(state_dir=state_dir, max_cache_entries=2)
+    for component in ["a", "b", "c"]:
+        await manager.save_state(component, sample_state)
+
+    assert list(manager._state_cache) == ["b", "c"]
+    assert await manager.load_state("a") == sample_state
+
+async def test_state_with_int_keys(state_manager):
+    """Test state with non-string keys is saved with stringified keys."""
+    component = "test_component"
+    state = {"balances": {1: 100, 2: 200}}
+
+    assert await state_manager.save_state(component, state) is True
+
+    await state_manager.clear_cache()
+    loaded_state = await state_manager.load_state(component)
+    assert loaded_state == {"balances": {"1": 100, "2": 200}}
+
+async def test_component_locks_released(state_manager, sample_state):
+    """Test per-component locks are not retained after use."""
+    for component in ["a", "b", "c"]:
+        await state_manager.save_state(component, sample_state)
+        await state_manager.load_state(component)
+
+    assert len(state_manager._locks) == 0
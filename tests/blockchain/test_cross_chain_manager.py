@@ -2,6 +2,7 @@
 Tests for cross-chain transaction manager.
 """
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 from genesis_replicator.blockchain.cross_chain_manager import (
@@ -131,3 +132,89 @@ async def test_transaction_failure(cross_chain_manager, transaction_manager):
 
     status = await cross_chain_manager.get_transaction_status(tx_id)
     assert status["status"] == "failed"
+
+@pytest.mark.asyncio
+async def test_confirmation_waits_for_new_heads(cross_chain_manager, chain_manager):
+    heads = asyncio.Queue()
+    for block in (101, 102):
+        heads.put_nowait(block)
+    chain_manager.subscribe_new_head = AsyncMock(return_value=heads)
+    chain_manager.unsubscribe_new_head = AsyncMock()
+    chain_manager.get_transaction_confirmations.side_effect = [0, 6, 12]
+
+    await cross_chain_manager._wait_for_confirmation("ethereum", "0x123")
+
+    # Re-checked once per new block instead of on a fixed timer
+    assert chain_manager.get_transaction_confirmations.await_count == 3
+    chain_manager.unsubscribe_new_head.assert_awaited_once_with("ethereum", heads)
+
+@pytest.mark.asyncio
+async def test_missing_dependency_not_registered(cross_chain_manager):
+    with pytest.raises(ValueError):
+        await cross_chain_manager.initiate_cross_chain_transaction(
+            "ethereum",
+            "bnb",
+            {},
+            {},
+            dependencies={"unknown"}
+        )
+
+    assert cross_chain_manager._transactions == {}
+
+@pytest.mark.asyncio
+async def test_confirmation_waiters_share_block_watcher(cross_chain_manager, chain_manager):
+    heads = asyncio.Queue()
+    chain_manager.subscribe_new_head = AsyncMock(return_value=heads)
+    chain_manager.unsubscribe_new_head = AsyncMock()
+    chain_manager.get_transaction_confirmations.return_value = 0
+
+    waits = [
+        asyncio.create_task(
+            cross_chain_manager._wait_for_confirmation("ethereum", tx_hash)
+        )
+        for tx_hash in ("0xaaa", "0xbbb")
+    ]
+    while len(cross_chain_manager._confirmation_waiters.get("ethereum", {})) < 2:
+        await asyncio.sleep(0)
+    chain_manager.get_transaction_confirmations.reset_mock()
+
+    chain_manager.get_transaction_confirmations.return_value = 12
+    heads.put_nowait(101)
+    await asyncio.gather(*waits)
+
+    # One subscription and one query per pending hash for the new block
+    chain_manager.subscribe_new_head.assert_awaited_once_with("ethereum")
+    assert chain_manager.get_transaction_confirmations.await_count == 2
+
+@pytest.mark.asyncio
+async def test_confirmation_watcher_torn_down_after_last_waiter(cross_chain_manager, chain_manager):
+    heads = asyncio.Queue()
+    chain_manager.subscribe_new_head = AsyncMock(return_value=heads)
+    chain_manager.unsubscribe_new_head = AsyncMock()
+    chain_manager.get_transaction_confirmations.return_value = 0
+
+    waits = {
+        tx_hash: asyncio.create_task(
+            cross_chain_manager._wait_for_confirmation("ethereum", tx_hash)
+        )
+        for tx_hash in ("0xaaa", "0xbbb")
+    }
+    while len(cross_chain_manager._confirmation_waiters.get("ethereum", {})) < 2:
+        await asyncio.sleep(0)
+    watcher = cross_chain_manager._confirmation_watchers["ethereum"]
+
+    # A cancelled waiter leaves the watcher running for the others
+    waits["0xaaa"].cancel()
+    await asyncio.gather(waits["0xaaa"], return_exceptions=True)
+    assert list(cross_chain_manager._confirmation_waiters["ethereum"]) == ["0xbbb"]
+    assert not watcher.done()
+
+    chain_manager.get_transaction_confirmations.return_value = 12
+    heads.put_nowait(101)
+    await waits["0xbbb"]
+    await watcher
+
+    # The last waiter leaving stops the watcher and its subscription
+    assert cross_chain_manager._confirmation_watchers == {}
+    assert cross_chain_manager._confirmation_waiters == {}
+    chain_manager.unsubscribe_new_head.assert_awaited_once_with("ethereum", heads)
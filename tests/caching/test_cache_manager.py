@@ -112,3 +112,28 @@ async def test_cache_concurrent_access():
     assert stats["total_entries"] == 50
 
     await manager.stop()
+
+@pytest.mark.asyncio
+async def test_cache_reset_outlives_original_ttl():
+    manager = CacheManager(max_size=10, default_ttl=60)
+
+    # Re-setting a key must not expire it on the original deadline
+    await manager.set("key1", "value1", ttl=1)
+    await manager.set("key1", "value2", ttl=60)
+    await asyncio.sleep(1.1)
+    manager._remove_expired()
+
+    assert await manager.get("key1") == "value2"
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    manager = CacheManager(max_size=3, default_ttl=60)
+    for key in ("key1", "key2", "key3"):
+        await manager.set(key, key)
+
+    # Touch key1 so key2 becomes the least recently used
+    await manager.get("key1")
+    await manager.set("key4", "key4")
+
+    assert await manager.get("key2") is None
+    assert await manager.get("key1") == "key1"
@@ -2,6 +2,7 @@
 Tests for deployment orchestrator.
 """
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
@@ -82,6 +83,23 @@ async def test_get_deployment_status(orchestrator, deployment_config):
     assert status.metrics == {"accuracy": 0.95}
     assert status.health_status == "healthy"
 
+@pytest.mark.asyncio
+async def test_get_deployment_status_does_not_mutate_stored(orchestrator, deployment_config):
+    deployment_id = await orchestrator.deploy_model(deployment_config)
+    await orchestrator.get_deployment_status(deployment_id)
+
+    stored = (await orchestrator.list_deployments())[0]
+    assert stored.metrics == {}
+    assert stored.health_status == "unknown"
+
+@pytest.mark.asyncio
+async def test_get_deployment_status_propagates_errors(orchestrator, deployment_config):
+    deployment_id = await orchestrator.deploy_model(deployment_config)
+    orchestrator._metrics_collector.get_metrics.side_effect = RuntimeError("down")
+
+    with pytest.raises(RuntimeError, match="down"):
+        await orchestrator.get_deployment_status(deployment_id)
+
 @pytest.mark.asyncio
 async def test_list_deployments(orchestrator, deployment_config):
     await orchestrator.deploy_model(deployment_config)
@@ -101,3 +119,52 @@ async def test_undeploy_model(orchestrator, deployment_config):
 async def test_undeploy_nonexistent_model(orchestrator):
     with pytest.raises(ValueError):
         await orchestrator.undeploy_model("nonexistent-id")
+
+@pytest.mark.asyncio
+async def test_list_deployments_by_environment(orchestrator, deployment_config):
+    deployment_id = await orchestrator.deploy_model(deployment_config)
+
+    assert len(await orchestrator.list_deployments("production")) == 1
+    assert await orchestrator.list_deployments("staging") == []
+
+    await orchestrator.undeploy_model(deployment_id)
+    assert await orchestrator.list_deployments("production") == []
+
+@pytest.mark.asyncio
+async def test_deployments_configure_concurrently(orchestrator, deployment_config, metrics_collector):
+    started = 0
+    release = asyncio.Event()
+
+    async def configure_monitoring(deployment_id, monitoring_config):
+        nonlocal started
+        started += 1
+        await release.wait()
+
+    metrics_collector.configure_monitoring = AsyncMock(side_effect=configure_monitoring)
+    staging_config = DeploymentConfig(
+        model_name=deployment_config.model_name,
+        version_id=deployment_config.version_id,
+        environment="staging",
+        resources=deployment_config.resources,
+        scaling_config=deployment_config.scaling_config,
+        monitoring_config=deployment_config.monitoring_config
+    )
+
+    deploys = [
+        asyncio.create_task(orchestrator.deploy_model(config))
+        for config in (deployment_config, staging_config)
+    ]
+    await asyncio.sleep(0.01)
+
+    # Different deployments do not wait for each other's setup
+    assert started == 2
+    release.set()
+    await asyncio.gather(*deploys)
+
+@pytest.mark.asyncio
+async def test_deployment_locks_released(orchestrator, deployment_config):
+    deployment_id = await orchestrator.deploy_model(deployment_config)
+    await orchestrator.undeploy_model(deployment_id)
+
+    # No lock is retained once the deployment's operations finish
+    assert len(orchestrator._locks) == 0
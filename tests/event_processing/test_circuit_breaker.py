@@ -102,3 +102,97 @@ async def test_manual_reset(circuit_breaker):
     assert stats["current_state"] == CircuitState.CLOSED.value
     assert stats["total_requests"] == 0
     assert stats["failed_requests"] == 0
+
+@pytest.mark.asyncio
+async def test_reset_scheduler_shared_across_circuits(circuit_breaker):
+    async def failing_operation():
+        raise RuntimeError("Operation failed")
+
+    circuit_ids = [f"circuit_{i}" for i in range(5)]
+    for circuit_id in circuit_ids:
+        for _ in range(10):
+            try:
+                await circuit_breaker.execute(circuit_id, failing_operation)
+            except RuntimeError:
+                pass
+
+    # Every open circuit is served by one scheduler task
+    scheduler = circuit_breaker._reset_scheduler
+    assert scheduler is not None
+    assert len(circuit_breaker._reset_deadlines) == 5
+
+    await asyncio.sleep(0.2)
+    for circuit_id in circuit_ids:
+        stats = await circuit_breaker.get_circuit_stats(circuit_id)
+        assert stats["current_state"] == CircuitState.HALF_OPEN.value
+    assert scheduler.done()
+
+@pytest.mark.asyncio
+async def test_get_open_circuits(circuit_breaker):
+    async def failing_operation():
+        raise RuntimeError("Operation failed")
+
+    async def success_operation():
+        return "success"
+
+    await circuit_breaker.execute("healthy_circuit", success_operation)
+    for _ in range(10):
+        try:
+            await circuit_breaker.execute("test_circuit", failing_operation)
+        except RuntimeError:
+            pass
+
+    assert await circuit_breaker.get_open_circuits() == ["test_circuit"]
+
+    await circuit_breaker.reset_circuit("test_circuit")
+    assert await circuit_breaker.get_open_circuits() == []
+
+@pytest.mark.asyncio
+async def test_half_open_success_does_not_close_reopened_circuit(circuit_breaker):
+    async def failing_operation():
+        raise RuntimeError("Operation failed")
+
+    async def success_operation():
+        return "success"
+
+    for _ in range(10):
+        try:
+            await circuit_breaker.execute("test_circuit", failing_operation)
+        except RuntimeError:
+            pass
+    await asyncio.sleep(0.2)
+    stats = await circuit_breaker.get_circuit_stats("test_circuit")
+    assert stats["current_state"] == CircuitState.HALF_OPEN.value
+
+    # Hold the circuit lock so the failure and the success race for it
+    lock = circuit_breaker._lock_for("test_circuit")
+    await lock.acquire()
+    failure = asyncio.create_task(
+        circuit_breaker.execute("test_circuit", failing_operation)
+    )
+    success = asyncio.create_task(
+        circuit_breaker.execute("test_circuit", success_operation)
+    )
+    await asyncio.sleep(0)
+    lock.release()
+
+    assert await success == "success"
+    with pytest.raises(RuntimeError, match="Operation failed"):
+        await failure
+
+    # The failure reopened the circuit; the late success must not close it
+    stats = await circuit_breaker.get_circuit_stats("test_circuit")
+    assert stats["current_state"] == CircuitState.OPEN.value
+    assert "test_circuit" in circuit_breaker._reset_deadlines
+
+@pytest.mark.asyncio
+async def test_circuit_locks_released(circuit_breaker):
+    async def success_operation():
+        return "success"
+
+    for i in range(5):
+        await circuit_breaker.execute(f"circuit_{i}", success_operation)
+        await circuit_breaker.get_circuit_stats(f"circuit_{i}")
+
+    # Locks are dropped once nothing holds or waits on them
+    assert len(circuit_breaker._locks) == 0
@@ -107,3 +107,109 @@ async def test_batch_stats(event_batcher):
     assert "pending_events" in stats
     assert "event_types" in stats
     assert "test_event" in stats["event_types"]
+
+@pytest.mark.asyncio
+async def test_batch_size_grows_under_load(event_batcher):
+    processed_batches = []
+    release = asyncio.Event()
+    async def processor(batch: EventBatch):
+        await release.wait()
+        processed_batches.append(batch)
+
+    await event_batcher.register_processor("test_event", processor)
+
+    # First batch fills at max_batch_size and keeps its processor busy
+    for i in range(5):
+        await event_batcher.add_event("test_event", {"id": i})
+    await asyncio.sleep(0)
+
+    # With one of four batches in flight the trigger is 25% higher
+    for i in range(6):
+        await event_batcher.add_event("test_event", {"id": i})
+    stats = await event_batcher.get_batch_stats()
+    assert stats["target_batch_size"] == 6
+    assert stats["pending_events"]["test_event"] == 0
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert sorted(batch.size for batch in processed_batches) == [5, 6]
+
+@pytest.mark.asyncio
+async def test_batch_timer_shared_across_event_types(event_batcher):
+    processed_batches = []
+    async def processor(batch: EventBatch):
+        processed_batches.append(batch)
+
+    event_types = [f"type{i}" for i in range(5)]
+    for event_type in event_types:
+        await event_batcher.register_processor(event_type, processor)
+        for i in range(2):
+            await event_batcher.add_event(event_type, {"id": i})
+
+    # Every pending event type is served by one timer handle
+    assert event_batcher._timer_handle is not None
+    assert len(event_batcher._deadline_for) == 5
+
+    await asyncio.sleep(0.2)
+    assert len(processed_batches) == 5
+    assert event_batcher._timer_handle is None
+
+@pytest.mark.asyncio
+async def test_batch_processor_started_eagerly(event_batcher):
+    processed_batches = []
+    async def processor(batch: EventBatch):
+        processed_batches.append(batch)
+
+    await event_batcher.register_processor("test_event", processor)
+    for i in range(5):
+        await event_batcher.add_event("test_event", {"id": i})
+
+    # Ran inside add_event, without yielding to the event loop
+    assert len(processed_batches) == 1
+
+@pytest.mark.asyncio
+async def test_batch_priority_and_tags(event_batcher):
+    processed_batches = []
+    async def processor(batch: EventBatch):
+        processed_batches.append(batch)
+
+    await event_batcher.register_processor("test_event", processor)
+    for i in range(5):
+        await event_batcher.add_event(
+            "test_event",
+            {"id": i},
+            priority=i,
+            tags={f"tag{i % 2}"}
+        )
+
+    batch = processed_batches[0]
+    assert batch.priority == 2
+    assert batch.tags == {"tag0", "tag1"}
+    assert [event["data"]["id"] for event in batch.events] == list(range(5))
+
+@pytest.mark.asyncio
+async def test_small_batch_flushed_after_max_wait(event_batcher):
+    processed_batches = []
+    async def processor(batch: EventBatch):
+        processed_batches.append(batch)
+
+    await event_batcher.register_processor("test_event", processor)
+    await event_batcher.add_event("test_event", {"id": 0})
+
+    # A lone event is not held back waiting for more
+    await asyncio.sleep(0.2)
+    assert [batch.size for batch in processed_batches] == [1]
+
+@pytest.mark.asyncio
+async def test_batch_ids_unique_per_event_type(event_batcher):
+    processed_batches = []
+    async def processor(batch: EventBatch):
+        processed_batches.append(batch)
+
+    await event_batcher.register_processor("test_event", processor)
+    for i in range(10):
+        await event_batcher.add_event("test_event", {"id": i})
+
+    assert [batch.batch_id for batch in processed_batches] == [
+        "test_event-0", "test_event-1"
+    ]
@@ -2,7 +2,7 @@
 Tests for BNB Chain protocol adapter.
 """
 import pytest
-from web3 import Web3
+from web3 import AsyncWeb3
 from web3.types import Wei
 
 from genesis_replicator.foundation_services.blockchain_integration.protocols.bnb_chain import (
@@ -24,8 +24,8 @@ async def test_chain_configuration():
 
 @pytest.mark.asyncio
 async def test_web3_configuration(bnb_adapter):
-    assert isinstance(bnb_adapter.web3, Web3)
-    assert bnb_adapter.web3.is_connected()
+    assert isinstance(bnb_adapter.web3, AsyncWeb3)
+    assert await bnb_adapter.web3.is_connected()
     chain_id = await bnb_adapter.web3.eth.chain_id
     assert chain_id == 56
 
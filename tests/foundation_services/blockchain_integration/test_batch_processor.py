@@ -0,0 +1,273 @@
+"""
+Tests for the blockchain batch processor.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+
+from genesis_replicator.foundation_services.exceptions import TransactionError
+from genesis_replicator.foundation_services.blockchain_integration.batch_processor import BatchProcessor
+
+# Defaults filled from the mocked node, and their JSON-RPC encoding
+DEFAULTS = {
+    'chainId': 56,
+    'maxPriorityFeePerGas': 1,
+    'maxFeePerGas': 201,
+    'gas': 21000,
+}
+RPC_DEFAULTS = {
+    'chainId': '0x38',
+    'maxPriorityFeePerGas': '0x1',
+    'maxFeePerGas': '0xc9',
+    'gas': '0x5208',
+}
+
+
+def node_value(value):
+    """Property mock returning a fresh awaitable per access, like web3."""
+    async def fetch():
+        return value
+    return PropertyMock(side_effect=fetch)
+
+
+@pytest.fixture
+def batch_processor():
+    """Create a batch processor instance."""
+    processor = BatchProcessor()
+    processor.configure(batch_size=3, batch_interval=0.05, max_retries=1)
+    return processor
+
+
+@pytest.fixture
+def mock_web3():
+    """Create a mock Web3 instance whose provider supports batching."""
+    web3 = MagicMock()
+    web3.provider.make_batch_request = AsyncMock()
+    web3.eth.send_transaction = AsyncMock(return_value=MagicMock())
+    web3.eth.send_raw_transaction = AsyncMock(return_value=MagicMock())
+    # Default lookups go out one by one unless a test sets up batching
+    web3.batch_requests.side_effect = NotImplementedError
+    type(web3.eth).chain_id = node_value(56)
+    type(web3.eth).max_priority_fee = node_value(1)
+    web3.eth.get_block = AsyncMock(return_value={'baseFeePerGas': 100})
+    web3.eth.estimate_gas = AsyncMock(return_value=21000)
+    return web3
+
+
+@pytest.mark.asyncio
+async def test_batch_sent_in_one_request(batch_processor, mock_web3):
+    """Test a full batch is submitted as a single JSON-RPC batch."""
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(3)
+    ]
+
+    for i in range(3):
+        await batch_processor.add_transaction(
+            {'web3': mock_web3, 'to': f'0x{i:040x}', 'value': 1000}
+        )
+
+    mock_web3.provider.make_batch_request.assert_awaited_once()
+    requests = mock_web3.provider.make_batch_request.await_args.args[0]
+    assert [method for method, _ in requests] == ['eth_sendTransaction'] * 3
+    assert requests[0][1] == [{'to': f'0x{0:040x}', 'value': '0x3e8', **RPC_DEFAULTS}]
+    mock_web3.eth.send_transaction.assert_not_awaited()
+    assert not batch_processor._batch_queue
+
+
+@pytest.mark.asyncio
+async def test_only_failed_transactions_retried(batch_processor, mock_web3):
+    """Test failed entries of a batch response are requeued on their own."""
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': 0, 'result': '0x0'},
+        {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'nonce too low'}},
+        {'jsonrpc': '2.0', 'id': 2, 'result': '0x2'},
+    ]
+
+    transactions = [{'web3': mock_web3, 'nonce': i} for i in range(3)]
+    for tx in transactions:
+        await batch_processor.add_transaction(tx)
+
+    # Requeued only after the backoff interval
+    assert not batch_processor._batch_queue
+    await asyncio.sleep(0.1)
+    assert list(batch_processor._batch_queue) == [transactions[1]]
+    assert transactions[1] == {'web3': mock_web3, 'nonce': 1}
+
+
+@pytest.mark.asyncio
+async def test_add_transaction_not_blocked_by_batch_in_flight(batch_processor, mock_web3):
+    """Test transactions can be queued while a batch is being sent."""
+    release = asyncio.Event()
+
+    async def slow_batch_request(requests):
+        await release.wait()
+        return [{'jsonrpc': '2.0', 'id': i, 'result': '0x0'} for i in range(len(requests))]
+
+    mock_web3.provider.make_batch_request.side_effect = slow_batch_request
+
+    sending = asyncio.gather(*(
+        batch_processor.add_transaction({'web3': mock_web3, 'nonce': i})
+        for i in range(3)
+    ))
+    await asyncio.sleep(0)
+
+    # Queued straight away rather than waiting for the batch to finish
+    await asyncio.wait_for(
+        batch_processor.add_transaction({'web3': mock_web3, 'nonce': 3}),
+        timeout=1
+    )
+    assert len(batch_processor._batch_queue) == 1
+
+    release.set()
+    await sending
+
+
+@pytest.mark.asyncio
+async def test_transaction_dropped_after_max_retries(batch_processor, mock_web3):
+    """Test retry bookkeeping is cleared once a transaction gives up."""
+    batch_processor.configure(batch_size=1)
+    mock_web3.eth.send_transaction.side_effect = TransactionError("rejected")
+
+    await batch_processor.add_transaction({'web3': mock_web3, 'nonce': 0})
+    await asyncio.sleep(0.1)
+    assert len(batch_processor._batch_queue) == 1
+
+    await batch_processor._process_batch()
+    assert not batch_processor._batch_queue
+    assert not batch_processor._retries
+
+
+@pytest.mark.asyncio
+async def test_add_transaction_waits_when_queue_full(batch_processor, mock_web3):
+    """Test producers are held back while the queue is at its limit."""
+    batch_processor.configure(max_queue_size=4)
+    release = asyncio.Event()
+
+    async def slow_batch_request(requests):
+        await release.wait()
+        return [{'jsonrpc': '2.0', 'id': i, 'result': '0x0'} for i in range(len(requests))]
+
+    mock_web3.provider.make_batch_request.side_effect = slow_batch_request
+
+    # Fill a batch in flight, then the queue behind it
+    sending = asyncio.gather(*(
+        batch_processor.add_transaction({'web3': mock_web3, 'nonce': i})
+        for i in range(7)
+    ))
+    await asyncio.sleep(0)
+    assert len(batch_processor._batch_queue) == 4
+
+    blocked = asyncio.create_task(
+        batch_processor.add_transaction({'web3': mock_web3, 'nonce': 7})
+    )
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await sending
+
+
+@pytest.mark.asyncio
+async def test_transactions_routed_by_registered_sender(batch_processor, mock_web3):
+    """Test transactions can reference a registered connection by index."""
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(3)
+    ]
+    chain_idx = batch_processor.register_sender(mock_web3)
+    assert batch_processor.register_sender(mock_web3) == chain_idx
+
+    for i in range(3):
+        await batch_processor.add_transaction({'chain_idx': chain_idx, 'nonce': i})
+
+    requests = mock_web3.provider.make_batch_request.await_args.args[0]
+    assert [params for _, params in requests] == [
+        [{'nonce': hex(i), **RPC_DEFAULTS}] for i in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batched_and_single_sends_match(batch_processor, mock_web3):
+    """Test a transaction is sent with the same parameters on both paths."""
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(3)
+    ]
+    transaction = {'web3': mock_web3, 'to': f'0x{1:040x}', 'value': 1000}
+
+    for _ in range(3):
+        await batch_processor.add_transaction(dict(transaction))
+    batched = mock_web3.provider.make_batch_request.await_args.args[0][0][1][0]
+
+    batch_processor.configure(batch_size=1)
+    await batch_processor.add_transaction(dict(transaction))
+    single = mock_web3.eth.send_transaction.await_args.args[0]
+
+    assert single == {'to': f'0x{1:040x}', 'value': 1000, **DEFAULTS}
+    assert batched == BatchProcessor._to_rpc_params(single)
+
+
+@pytest.mark.asyncio
+async def test_defaults_looked_up_in_one_batch(batch_processor, mock_web3):
+    """Test default lookups for a whole batch share one JSON-RPC batch."""
+    lookup_batch = MagicMock()
+    lookup_batch.__aenter__.return_value = lookup_batch
+    lookup_batch.async_execute = AsyncMock(
+        return_value=[56, 1, {'baseFeePerGas': 100}, 21000, 22000, 23000]
+    )
+    mock_web3.batch_requests.side_effect = None
+    mock_web3.batch_requests.return_value = lookup_batch
+    type(mock_web3.eth).chain_id = PropertyMock(return_value=56)
+    type(mock_web3.eth).max_priority_fee = PropertyMock(return_value=1)
+    mock_web3.eth.get_block = MagicMock()
+    mock_web3.eth.estimate_gas = MagicMock()
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(3)
+    ]
+
+    for i in range(3):
+        await batch_processor.add_transaction({'web3': mock_web3, 'nonce': i})
+
+    # Chain id, fee data and one estimate per transaction in one request
+    assert lookup_batch.add.call_count == 6
+    lookup_batch.async_execute.assert_awaited_once()
+    requests = mock_web3.provider.make_batch_request.await_args.args[0]
+    assert [params[0]['gas'] for _, params in requests] == [
+        hex(21000), hex(22000), hex(23000)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_signed_transactions_sent_raw(batch_processor, mock_web3):
+    """Test pre-signed transactions are batched without default lookups."""
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(3)
+    ]
+
+    for i in range(3):
+        await batch_processor.add_transaction(
+            {'web3': mock_web3, 'raw_transaction': bytes([i])}
+        )
+
+    requests = mock_web3.provider.make_batch_request.await_args.args[0]
+    assert requests == [
+        ('eth_sendRawTransaction', [f'0x0{i}']) for i in range(3)
+    ]
+    mock_web3.eth.estimate_gas.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_estimate_fails_only_its_transaction(batch_processor, mock_web3):
+    """Test a transaction whose gas cannot be estimated is retried alone."""
+    mock_web3.eth.estimate_gas.side_effect = [21000, ValueError("reverted"), 21000]
+    mock_web3.provider.make_batch_request.return_value = [
+        {'jsonrpc': '2.0', 'id': i, 'result': f'0x{i}'} for i in range(2)
+    ]
+
+    transactions = [{'web3': mock_web3, 'nonce': i} for i in range(3)]
+    for tx in transactions:
+        await batch_processor.add_transaction(tx)
+
+    requests = mock_web3.provider.make_batch_request.await_args.args[0]
+    assert [params[0]['nonce'] for _, params in requests] == ['0x0', '0x2']
+    await asyncio.sleep(0.1)
+    assert list(batch_processor._batch_queue) == [transactions[1]]
@@ -3,7 +3,8 @@ Tests for the Chain Manager implementation.
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, patch
+import aiohttp
+from unittest.mock import AsyncMock, Mock, patch
 from genesis_replicator.foundation_services.blockchain_integration.chain_manager import ChainManager
 
 @pytest.fixture
@@ -151,3 +152,106 @@ async def test_multi_chain_support():
     assert len(chains) == 2
 
     await manager.stop()
+
+@pytest.mark.asyncio
+async def test_head_watcher_survives_transport_errors():
+    """Test new heads keep arriving after a transport error."""
+    manager = ChainManager(head_poll_interval=0.01)
+    responses = iter([100, aiohttp.ClientConnectionError("reset"), 101])
+
+    class Eth:
+        @property
+        def block_number(self):
+            async def fetch():
+                result = next(responses, 101)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            return fetch()
+
+    web3 = Mock()
+    web3.eth = Eth()
+    manager._connections["ethereum"] = web3
+
+    heads = await manager.subscribe_new_head("ethereum")
+    assert await asyncio.wait_for(heads.get(), timeout=1) == 100
+    assert await asyncio.wait_for(heads.get(), timeout=1) == 101
+    assert not manager._head_watchers["ethereum"].done()
+
+    await manager.unsubscribe_new_head("ethereum", heads)
+
+@pytest.mark.asyncio
+async def test_chain_status_falls_back_when_batch_fails():
+    """Test chain status is fetched per call when batching fails."""
+    manager = ChainManager()
+
+    def resolved(value):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        return future
+
+    class Eth:
+        get_block_number = Mock()
+
+        @property
+        def block_number(self):
+            return resolved(100)
+
+        @property
+        def gas_price(self):
+            return resolved(5)
+
+        @property
+        def syncing(self):
+            return resolved(False)
+
+    batch = Mock()
+    batch.__aenter__ = AsyncMock(return_value=batch)
+    batch.__aexit__ = AsyncMock(return_value=False)
+    batch.async_execute = AsyncMock(side_effect=Exception("batch not supported"))
+    web3 = Mock()
+    web3.eth = Eth()
+    web3.batch_requests.return_value = batch
+    manager._connections["ethereum"] = web3
+
+    status = await manager.get_chain_status("ethereum")
+
+    batch.async_execute.assert_awaited_once()
+    assert status["block_number"] == 100
+    assert status["gas_price"] == 5
+    assert status["syncing"] is False
+
+@pytest.mark.asyncio
+async def test_adapter_connections_share_pooled_session():
+    """Test adapters get the shared HTTP session, renewed after a restart."""
+    from genesis_replicator.foundation_services.blockchain_integration.protocols.base import (
+        BaseProtocolAdapter
+    )
+
+    sessions = []
+
+    class RecordingAdapter(BaseProtocolAdapter):
+        async def configure_web3(self, provider_url, session=None):
+            sessions.append(session)
+            chain_id = asyncio.get_running_loop().create_future()
+            chain_id.set_result(1)
+            self.web3 = Mock()
+            self.web3.eth.chain_id = chain_id
+
+        estimate_gas = get_transaction_receipt = send_transaction = None
+        validate_address = get_balance = get_block = get_gas_price = None
+
+    RecordingAdapter.__abstractmethods__ = frozenset()
+
+    manager = ChainManager()
+    for _ in range(2):
+        await manager.start()
+        await manager.register_protocol_adapter("test", RecordingAdapter())
+        await manager.connect_to_chain("chain", "http://localhost:8545", protocol="test")
+        await manager.stop()
+
+    first, second = sessions
+    assert first is not None and second is not None
+    assert first is not second
+    assert first.closed and second.closed
+    assert manager._connection_pool == {}